@@ -674,12 +674,12 @@ async def run_citation_extraction_job(batch_size: int):
             logger.error("Failed to initialize citations service for background job")
             return
 
-        citations = await citations_service.extract_citations_from_publications(
+        extracted = await citations_service.extract_citations_from_publications(
             batch_size
         )
 
         logger.info(
-            f"Citation extraction job completed: {len(citations)} citations extracted"
+            f"Citation extraction job completed: {extracted} citations extracted"
         )
 
     except Exception as e:
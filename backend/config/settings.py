@@ -83,6 +83,11 @@ class Settings(BaseSettings):
 
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 100
+    BACKFILL_FIELD_CONCURRENCY: int = 4
+    BACKFILL_PERPLEXITY_RPM: int = 50
+    BACKFILL_SERPER_RPM: int = 300
+    BACKFILL_OPENAI_RPM: int = 500
+    BACKFILL_WORKERS: int = 4
 
     # Background Tasks
     CELERY_BROKER_URL: str = "redis://localhost:6379/1"
@@ -70,17 +70,21 @@ class IntelligenceReport:
 class PerplexityAfricanAIModule:
     """Advanced AI intelligence synthesis using Perplexity API"""
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, connector: Optional[aiohttp.BaseConnector] = None):
         self.api_key = api_key
         self.base_url = "https://api.perplexity.ai"
         self.session: Optional[aiohttp.ClientSession] = None
+        # Optional shared connection pool, owned by the caller
+        self.connector = connector
 
     async def __aenter__(self):
         self.session = aiohttp.ClientSession(
             headers={
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json"
-            }
+            },
+            connector=self.connector,
+            connector_owner=self.connector is None
         )
         return self
 
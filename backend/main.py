@@ -154,6 +154,22 @@ async def shutdown_event():
     except Exception as e:
         logger.error(f"Error stopping enrichment scheduler: {e}")
 
+    # Close pooled OpenAI connections
+    try:
+        from services.advanced_ai_deduplication_service import (
+            advanced_ai_dedup_service,
+        )
+
+        await advanced_ai_dedup_service.aclose()
+    except Exception as e:
+        logger.error(f"Error closing advanced AI deduplication client: {e}")
+
+    # Close pooled backfill upstream connections
+    try:
+        await ai_backfill_service.stop()
+    except Exception as e:
+        logger.error(f"Error stopping AI backfill service clients: {e}")
+
 
 # Health Check
 @app.get("/health")
@@ -2004,8 +2020,8 @@ async def run_single_innovation_backfill(job_id: str, innovation: dict):
             f"Starting single innovation backfill job {job_id} for {innovation.get('title')}"
         )
 
-        # Create backfill job for single innovation
-        job = await ai_backfill_service.create_backfill_job(innovation)
+        # Create backfill job for single innovation, processed here rather than queued
+        job = await ai_backfill_service.create_backfill_job(innovation, enqueue=False)
 
         if job:
             # Process the job
@@ -2036,24 +2052,39 @@ async def apply_backfill_results_to_database(processed_jobs):
 
     supabase = get_supabase()
 
+    # Build every update first, then hand the batch to one writer thread so the
+    # blocking Supabase calls stay off the event loop
+    pending_updates = []
     for job in processed_jobs:
         if job.status.value == "completed" and job.results:
             try:
                 updates = await create_database_updates_from_backfill_job(job)
                 if updates:
-                    response = (
-                        supabase.table("innovations")
-                        .update(updates)
-                        .eq("id", job.innovation_id)
-                        .execute()
-                    )
-                    if response.data:
-                        logger.info(
-                            f"Applied backfill updates for innovation {job.innovation_id}"
-                        )
+                    pending_updates.append((job.innovation_id, updates))
             except Exception as e:
                 logger.error(f"Error applying backfill for {job.innovation_id}: {e}")
 
+    if pending_updates:
+        await asyncio.to_thread(write_backfill_updates, supabase, pending_updates)
+
+
+def write_backfill_updates(supabase, pending_updates):
+    """Write (innovation_id, updates) pairs from a backfill run to the database"""
+    # innovations has NOT NULL columns, so partial rows can't go through one bulk
+    # upsert; each row is its own update
+    for innovation_id, updates in pending_updates:
+        try:
+            response = (
+                supabase.table("innovations")
+                .update(updates)
+                .eq("id", innovation_id)
+                .execute()
+            )
+            if response.data:
+                logger.info(f"Applied backfill updates for innovation {innovation_id}")
+        except Exception as e:
+            logger.error(f"Error applying backfill for {innovation_id}: {e}")
+
 
 async def apply_single_backfill_result_to_database(job):
     """Apply single backfill result to database"""
@@ -2064,16 +2095,9 @@ async def apply_single_backfill_result_to_database(job):
     try:
         updates = await create_database_updates_from_backfill_job(job)
         if updates:
-            response = (
-                supabase.table("innovations")
-                .update(updates)
-                .eq("id", job.innovation_id)
-                .execute()
+            await asyncio.to_thread(
+                write_backfill_updates, supabase, [(job.innovation_id, updates)]
             )
-            if response.data:
-                logger.info(
-                    f"Applied single backfill updates for innovation {job.innovation_id}"
-                )
     except Exception as e:
         logger.error(f"Error applying single backfill for {job.innovation_id}: {e}")
 
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for the Redis-backed AI backfill job queue
+"""
+
+import asyncio
+import uuid
+
+import services.ai_backfill_service as backfill
+from services.ai_backfill_service import AIBackfillService
+
+
+def use_test_keys():
+    """Point the queue at throwaway keys so live backfill jobs are untouched"""
+    prefix = f"backfill_test_{uuid.uuid4().hex[:8]}"
+    backfill.BACKFILL_QUEUE_KEY = f"{prefix}:pending"
+    backfill.BACKFILL_IN_PROGRESS_KEY = f"{prefix}:in_progress"
+    backfill.BACKFILL_JOB_KEY_PREFIX = f"{prefix}:job:"
+    backfill.BACKFILL_INNOVATION_KEY_PREFIX = f"{prefix}:innovation:"
+    return prefix
+
+
+async def test_backfill_queue():
+    """Test enqueue, claim, finish and stale requeue against a real Redis"""
+    print("Testing AI backfill job queue...")
+
+    prefix = use_test_keys()
+    service = AIBackfillService()
+    await service._connect_job_queue()
+    redis = service._redis
+    if redis is None:
+        print("Redis is not available. Start Redis or set REDIS_URL first.")
+        return
+
+    innovation = {"id": f"innovation_{uuid.uuid4().hex[:8]}", "title": "Test"}
+    ok = True
+
+    def check(label, condition):
+        nonlocal ok
+        ok = ok and condition
+        print(f"  {'PASS' if condition else 'FAIL'}: {label}")
+
+    try:
+        print("\nTesting enqueue...")
+        job = await service.create_backfill_job(innovation)
+        check("job created", job is not None)
+        check("job queued", await redis.zcard(backfill.BACKFILL_QUEUE_KEY) == 1)
+        ttl = await redis.ttl(f"{backfill.BACKFILL_JOB_KEY_PREFIX}{job.job_id}")
+        check("job document expires", ttl > 0)
+
+        duplicate = await service.create_backfill_job(innovation)
+        check("duplicate innovation skipped", duplicate is None)
+        check(
+            "queue depth unchanged", await redis.zcard(backfill.BACKFILL_QUEUE_KEY) == 1
+        )
+
+        print("\nTesting claim...")
+        claimed = await service._claim_next_job()
+        check(
+            "claimed queued job", claimed is not None and claimed.job_id == job.job_id
+        )
+        check("queue empty", await redis.zcard(backfill.BACKFILL_QUEUE_KEY) == 0)
+        check(
+            "job in progress",
+            await redis.zscore(backfill.BACKFILL_IN_PROGRESS_KEY, job.job_id)
+            is not None,
+        )
+        check(
+            "running innovation not requeued",
+            await service.create_backfill_job(innovation) is None,
+        )
+        check("nothing left to claim", await service._claim_next_job() is None)
+
+        print("\nTesting stale requeue...")
+        timeout = backfill.BACKFILL_CLAIM_TIMEOUT_SECONDS
+        backfill.BACKFILL_CLAIM_TIMEOUT_SECONDS = -1
+        try:
+            await service._requeue_stale_claims()
+        finally:
+            backfill.BACKFILL_CLAIM_TIMEOUT_SECONDS = timeout
+        check(
+            "stale claim requeued", await redis.zcard(backfill.BACKFILL_QUEUE_KEY) == 1
+        )
+        check(
+            "in-progress set empty",
+            await redis.zcard(backfill.BACKFILL_IN_PROGRESS_KEY) == 0,
+        )
+
+        print("\nTesting finish...")
+        reclaimed = await service._claim_next_job()
+        check(
+            "requeued job claimed again",
+            reclaimed is not None and reclaimed.job_id == job.job_id,
+        )
+        await service._finish_claimed_job(reclaimed)
+        check(
+            "in-progress set empty",
+            await redis.zcard(backfill.BACKFILL_IN_PROGRESS_KEY) == 0,
+        )
+        check(
+            "job document deleted",
+            not await redis.exists(f"{backfill.BACKFILL_JOB_KEY_PREFIX}{job.job_id}"),
+        )
+        check(
+            "finished innovation can be queued again",
+            await service.create_backfill_job(innovation) is not None,
+        )
+    finally:
+        keys = [key async for key in redis.scan_iter(f"{prefix}:*")]
+        if keys:
+            await redis.delete(*keys)
+        await redis.close()
+
+    print(f"\nTest {'completed successfully' if ok else 'FAILED'}!")
+
+
+if __name__ == "__main__":
+    asyncio.run(test_backfill_queue())
@@ -4,15 +4,56 @@ Handles complex relationships like multiple innovations funded by one source
 and linking related entities across different news events
 """
 
-import json
-from dataclasses import dataclass, field
+import asyncio
+import base64
+import copy
+import hashlib
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
 
+import httpx
+import numpy as np
 import openai
+import orjson
+from aiolimiter import AsyncLimiter
 from config.settings import settings
 from loguru import logger
+from pydantic import BaseModel, Field, ValidationError, field_validator
+from services.unified_cache import (
+    DataSource,
+    cache_api_response,
+    get_cached_response,
+)
+
+try:
+    import h2  # noqa: F401  # enables httpx HTTP/2 support
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Cosine similarity above which a new article reuses a cached extraction
+SEMANTIC_CACHE_THRESHOLD = 0.92
+# Sentence transformer used to embed articles for the semantic cache
+SEMANTIC_CACHE_MODEL = "all-MiniLM-L6-v2"
+# Newest semantic cache entries kept in memory and persisted to Redis between ETL runs
+SEMANTIC_CACHE_MAX_ENTRIES = 2000
+SEMANTIC_CACHE_TTL_HOURS = 168.0
+# Minimum seconds between Redis writes of the semantic cache outside aclose()
+SEMANTIC_CACHE_SAVE_INTERVAL_SECONDS = 600.0
+# Nearest neighbours per event considered as relationship candidates
+RELATIONSHIP_CANDIDATE_K = 10
+# Event pairs classified per relationship-analysis AI call
+RELATIONSHIP_BATCH_SIZE = 10
+# Rough prompt characters per token, for charging requests against the TPM cap
+CHARS_PER_TOKEN = 4
+# Upper bound on a single extraction request, once sent, before falling back
+# to a basic event
+EXTRACTION_TIMEOUT_SECONDS = 15
 
 
 class RelationshipType(Enum):
@@ -70,6 +111,21 @@ class EnhancedEventInfo:
     confidence_score: float = 0.0
     relationships: List[EventRelationship] = field(default_factory=list)
 
+    # Lowercased comparison keys, derived once in __post_init__
+    _lc_primary: str = field(init=False, repr=False, compare=False)
+    _lc_secondaries: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _lc_investor: str = field(init=False, repr=False, compare=False)
+    _lc_program: str = field(init=False, repr=False, compare=False)
+    _lc_location: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        funding_info = self.funding_info or {}
+        self._lc_primary = (self.primary_entity or "").lower()
+        self._lc_secondaries = frozenset(e.lower() for e in self.secondary_entities)
+        self._lc_investor = (funding_info.get("investor") or "").lower()
+        self._lc_program = (funding_info.get("program") or "").lower()
+        self._lc_location = (self.location or "").lower()
+
 
 @dataclass
 class EventCluster:
@@ -84,14 +140,117 @@ class EventCluster:
     total_impact: Dict[str, Any] = field(default_factory=dict)  # aggregated metrics
 
 
+class _LLMResponseSchema(BaseModel):
+    """Base for AI reply schemas: explicit nulls fall back to the field default"""
+
+    @field_validator("*", mode="before")
+    @classmethod
+    def _null_to_default(cls, value: Any, info) -> Any:
+        if value is None:
+            return cls.model_fields[info.field_name].get_default(
+                call_default_factory=True
+            )
+        return value
+
+
+class ExtractedEventSchema(_LLMResponseSchema):
+    """Event extraction reply from the AI model"""
+
+    event_type: str = "other"
+    primary_entity: str = ""
+    secondary_entities: List[str] = Field(default_factory=list)
+    funding_info: Dict[str, Any] = Field(default_factory=dict)
+    product_info: Dict[str, Any] = Field(default_factory=dict)
+    partnership_info: Dict[str, Any] = Field(default_factory=dict)
+    location: Optional[str] = None
+    description: str = ""
+    key_phrases: List[str] = Field(default_factory=list)
+    confidence: float = 0.5
+
+
+class RelationshipSchema(_LLMResponseSchema):
+    """Relationship analysis reply for one event pair"""
+
+    pair_idx: Optional[int] = None
+    relationship_type: RelationshipType = RelationshipType.NONE
+    confidence: float = 0.0
+    shared_entities: List[str] = Field(default_factory=list)
+    relationship_description: str = ""
+    supporting_evidence: List[str] = Field(default_factory=list)
+    key_differences: List[str] = Field(default_factory=list)
+
+    @field_validator("relationship_type", mode="before")
+    @classmethod
+    def _unknown_type_to_none(cls, value: Any) -> Any:
+        # Unknown relationship strings from the model map to NONE
+        if value in RelationshipType._value2member_map_:
+            return value
+        return RelationshipType.NONE
+
+
+class RelationshipBatchSchema(_LLMResponseSchema):
+    """Relationship analysis reply for a batch of event pairs
+
+    Entries stay raw here and are validated one by one as RelationshipSchema,
+    so a single malformed pair doesn't discard the rest of the batch.
+    """
+
+    results: List[Any] = Field(default_factory=list)
+
+
 class AdvancedAIDeduplicationService:
     """Advanced AI-powered service for complex relationship analysis and deduplication"""
 
-    def __init__(self):
-        self.client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    def __init__(
+        self,
+        max_concurrent: int = 20,
+        max_attempts: int = 5,
+        requests_per_minute: int = 500,
+        tokens_per_minute: int = 200_000,
+    ):
+        # One pooled HTTP client shared by every OpenAI request
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=httpx.Timeout(30.0),
+            http2=HTTP2_AVAILABLE,
+        )
+        # SDK retries off: _chat_completion and _stream_chat_content own the
+        # rate-limit backoff, so retries don't stack
+        self.client = openai.AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY, http_client=self._http, max_retries=0
+        )
         self.event_cache: Dict[str, EnhancedEventInfo] = {}
         self.relationship_cache: List[EventRelationship] = []
 
+        # Caps in-flight OpenAI requests and their per-minute request and
+        # estimated token rates to stay within the account's rate limits
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self._request_limiter = AsyncLimiter(requests_per_minute, 60)
+        self._token_limiter = AsyncLimiter(tokens_per_minute, 60)
+        self.max_attempts = max_attempts
+
+        # Semantic cache of extracted events, keyed by normalized article embedding
+        self._embedding_model = None
+        self._embedding_model_failed = False
+        self._embedding_model_loading: Optional[asyncio.Future] = None
+        # Ring buffer of the newest SEMANTIC_CACHE_MAX_ENTRIES entries: rows
+        # [0, count) are filled and `next` is the slot overwritten next
+        self._semantic_embeddings: Optional[np.ndarray] = None
+        self._semantic_events: List[Optional[EnhancedEventInfo]] = []
+        self._semantic_count = 0
+        self._semantic_next = 0
+        self._semantic_cache_loaded = False
+        self._semantic_cache_dirty = False
+        self._semantic_cache_saved_at = time.monotonic()
+
+        # Exact-match prompt cache statistics
+        self.stats = {"prompt_cache_hits": 0, "prompt_cache_misses": 0}
+
+    async def aclose(self):
+        """Persist the semantic cache and close the pooled HTTP client"""
+        await self._save_semantic_cache(force=True)
+        await self._http.aclose()
+
     async def analyze_complex_relationships(
         self, articles: List[Dict[str, Any]]
     ) -> Tuple[List[EventCluster], List[EnhancedEventInfo]]:
@@ -106,20 +265,44 @@ class AdvancedAIDeduplicationService:
             f"🔗 Starting advanced relationship analysis for {len(articles)} articles..."
         )
 
-        # Step 1: Extract enhanced event information from each article
+        # Reuse extractions persisted by earlier runs
+        await self._load_semantic_cache()
+
+        # Step 1: Extract enhanced event information concurrently, once per
+        # distinct article text; exact duplicates reuse the extraction. Near
+        # duplicates only hit the semantic cache across batches, since every
+        # lookup here runs before any extraction is stored
+        unique_indices, article_to_unique = self._dedupe_identical_articles(articles)
+        if len(unique_indices) < len(articles):
+            logger.info(
+                f"♻️ Skipping {len(articles) - len(unique_indices)} identical articles before extraction"
+            )
+
+        results = await asyncio.gather(
+            *(
+                self._extract_enhanced_event_info(articles[i], f"event_{i}")
+                for i in unique_indices
+            ),
+            return_exceptions=True,
+        )
+
         enhanced_events = []
-        for i, article in enumerate(articles):
-            try:
-                event_info = await self._extract_enhanced_event_info(
-                    article, f"event_{i}"
-                )
-                enhanced_events.append(event_info)
-            except Exception as e:
-                logger.error(f"❌ Error extracting enhanced event info: {e}")
+        for i, unique_idx in enumerate(article_to_unique):
+            result = results[unique_idx]
+            if isinstance(result, Exception):
+                if unique_indices[unique_idx] == i:
+                    logger.error(f"❌ Error extracting enhanced event info: {result}")
                 continue
+            enhanced_events.append(
+                result
+                if unique_indices[unique_idx] == i
+                else replace(copy.deepcopy(result), event_id=f"event_{i}")
+            )
 
         logger.info(f"📊 Extracted enhanced info for {len(enhanced_events)} events")
 
+        await self._save_semantic_cache()
+
         # Step 2: Identify relationships between events
         relationships = await self._identify_event_relationships(enhanced_events)
 
@@ -136,11 +319,354 @@ class AdvancedAIDeduplicationService:
 
         return clusters, standalone_events
 
+    @staticmethod
+    def _dedupe_identical_articles(
+        articles: List[Dict[str, Any]],
+    ) -> Tuple[List[int], List[int]]:
+        """Collapse articles with identical normalized title and snippet
+
+        Returns:
+            Tuple of (index of each distinct article's first occurrence,
+            position in that list for every article)
+        """
+
+        seen: Dict[str, int] = {}
+        unique_indices = []
+        article_to_unique = []
+
+        for i, article in enumerate(articles):
+            normalized = " ".join(
+                f"{article.get('title', '')} {article.get('snippet', '')}".lower().split()
+            )
+            content_hash = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+            if content_hash not in seen:
+                seen[content_hash] = len(unique_indices)
+                unique_indices.append(i)
+            article_to_unique.append(seen[content_hash])
+
+        return unique_indices, article_to_unique
+
+    async def _acquire_rate_limits(self, kwargs: Dict[str, Any]) -> None:
+        """Wait for request and estimated token capacity for one chat request"""
+
+        prompt_chars = sum(
+            len(message.get("content") or "") for message in kwargs.get("messages", [])
+        )
+        tokens = prompt_chars // CHARS_PER_TOKEN + (kwargs.get("max_tokens") or 0)
+        await self._request_limiter.acquire()
+        await self._token_limiter.acquire(min(tokens, self._token_limiter.max_rate))
+
+    async def _chat_completion(self, **kwargs):
+        """Call the chat completions API under the concurrency cap, retrying on rate limits"""
+
+        for attempt in range(self.max_attempts):
+            try:
+                await self._acquire_rate_limits(kwargs)
+                async with self._sem:
+                    return await self.client.chat.completions.create(**kwargs)
+            except openai.RateLimitError:
+                if attempt == self.max_attempts - 1:
+                    raise
+                await asyncio.sleep(2**attempt)
+
+    async def _stream_chat_content(
+        self, read_timeout: Optional[float] = None, **kwargs
+    ) -> str:
+        """Stream a JSON chat completion, returning as soon as the object is complete
+
+        `read_timeout` bounds each request once it holds a concurrency slot, so
+        queueing for the semaphore and rate-limit backoff don't count against it.
+        """
+
+        for attempt in range(self.max_attempts):
+            try:
+                await self._acquire_rate_limits(kwargs)
+                async with self._sem:
+                    return await asyncio.wait_for(
+                        self._read_chat_stream(**kwargs), timeout=read_timeout
+                    )
+            except openai.RateLimitError:
+                if attempt == self.max_attempts - 1:
+                    raise
+                await asyncio.sleep(2**attempt)
+
+    async def _read_chat_stream(self, **kwargs) -> str:
+        """Send one streaming chat request and read it until the JSON object parses"""
+
+        stream = await self.client.chat.completions.create(stream=True, **kwargs)
+        parts = []
+        try:
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                parts.append(delta)
+
+                # Stop reading once the buffered JSON object parses
+                if "}" in delta:
+                    buffered = "".join(parts)
+                    content = buffered[: buffered.rfind("}") + 1].strip()
+                    try:
+                        orjson.loads(content)
+                    except orjson.JSONDecodeError:
+                        continue
+                    return content
+        finally:
+            await stream.close()
+
+        return "".join(parts).strip()
+
+    async def _cached_chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: str = "gpt-4o-mini",
+        temperature: float = 0.1,
+        stream: bool = False,
+        read_timeout: Optional[float] = None,
+        **kwargs,
+    ) -> str:
+        """Return the chat completion content, reusing cached replies to identical prompts"""
+
+        prompt_hash = hashlib.sha256(
+            orjson.dumps(
+                {
+                    "model": model,
+                    "messages": messages,
+                    "temperature": temperature,
+                    "max_tokens": kwargs.get("max_tokens"),
+                },
+                option=orjson.OPT_SORT_KEYS,
+            )
+        ).hexdigest()
+        cache_params = {"prompt_hash": prompt_hash}
+
+        try:
+            cached_response = await get_cached_response(DataSource.OPENAI, cache_params)
+            if cached_response:
+                self.stats["prompt_cache_hits"] += 1
+                return cached_response["content"]
+        except Exception as e:
+            logger.warning(f"Error checking OpenAI prompt cache: {e}")
+
+        self.stats["prompt_cache_misses"] += 1
+        if stream:
+            response_content = await self._stream_chat_content(
+                read_timeout=read_timeout,
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                **kwargs,
+            )
+        else:
+            response = await self._chat_completion(
+                model=model, messages=messages, temperature=temperature, **kwargs
+            )
+            response_content = response.choices[0].message.content.strip()
+        if response_content:
+            try:
+                await cache_api_response(
+                    DataSource.OPENAI, cache_params, {"content": response_content}, 24.0
+                )
+            except Exception as e:
+                logger.warning(f"Error caching OpenAI response: {e}")
+
+        return response_content
+
+    async def _get_embedding_model(self):
+        """Lazily load the sentence transformer used by the semantic cache"""
+
+        if self._embedding_model is None and not self._embedding_model_failed:
+            # Importing torch and fetching the model takes seconds, so load it in
+            # a worker thread once, shared by every concurrent caller
+            loop = asyncio.get_running_loop()
+            if (
+                self._embedding_model_loading is None
+                or self._embedding_model_loading.get_loop() is not loop
+            ):
+                self._embedding_model_loading = loop.create_task(
+                    asyncio.to_thread(self._load_embedding_model)
+                )
+            await asyncio.shield(self._embedding_model_loading)
+
+        return self._embedding_model
+
+    def _load_embedding_model(self) -> None:
+        """Construct the sentence transformer, disabling the cache on failure"""
+
+        try:
+            from sentence_transformers import SentenceTransformer
+
+            self._embedding_model = SentenceTransformer(SEMANTIC_CACHE_MODEL)
+        except Exception as e:
+            logger.warning(f"Semantic event cache disabled: {e}")
+            self._embedding_model_failed = True
+
+    async def _embed_article(self, article: Dict[str, Any]) -> Optional[np.ndarray]:
+        """Embed an article's title and snippet as a unit-length vector"""
+
+        model = await self._get_embedding_model()
+        if model is None:
+            return None
+
+        text = f"{article.get('title', '')} {article.get('snippet', '')}"
+        try:
+            embeddings = await asyncio.to_thread(
+                model.encode, [text], normalize_embeddings=True
+            )
+            return np.asarray(embeddings[0], dtype=np.float32)
+        except Exception as e:
+            logger.warning(f"Error embedding article for semantic cache: {e}")
+            return None
+
+    def _lookup_semantic_cache(
+        self, embedding: np.ndarray, event_id: str
+    ) -> Optional[EnhancedEventInfo]:
+        """Return a copy of a cached event whose article is near-identical"""
+
+        if not self._semantic_count:
+            return None
+
+        similarities = self._semantic_embeddings[: self._semantic_count] @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < SEMANTIC_CACHE_THRESHOLD:
+            return None
+
+        return replace(copy.deepcopy(self._semantic_events[best]), event_id=event_id)
+
+    def _store_semantic_cache(
+        self, embedding: np.ndarray, event: EnhancedEventInfo
+    ) -> None:
+        """Add an extracted event to the cache, overwriting the oldest once full"""
+
+        if self._semantic_embeddings is None:
+            self._semantic_embeddings = np.empty(
+                (SEMANTIC_CACHE_MAX_ENTRIES, embedding.shape[0]), dtype=np.float32
+            )
+            self._semantic_events = [None] * SEMANTIC_CACHE_MAX_ENTRIES
+
+        slot = self._semantic_next
+        self._semantic_embeddings[slot] = embedding
+        self._semantic_events[slot] = copy.deepcopy(event)
+        self._semantic_next = (slot + 1) % SEMANTIC_CACHE_MAX_ENTRIES
+        self._semantic_count = min(self._semantic_count + 1, SEMANTIC_CACHE_MAX_ENTRIES)
+        self._semantic_cache_dirty = True
+
+    def _semantic_cache_entries(
+        self,
+    ) -> Tuple[np.ndarray, List[EnhancedEventInfo]]:
+        """Cached embeddings and events, oldest first"""
+
+        order = np.arange(self._semantic_count)
+        if self._semantic_count == SEMANTIC_CACHE_MAX_ENTRIES:
+            order = np.roll(order, -self._semantic_next)
+        return self._semantic_embeddings[order], [
+            self._semantic_events[i] for i in order
+        ]
+
+    async def _load_semantic_cache(self) -> None:
+        """Load semantic cache entries persisted by earlier runs from Redis"""
+
+        if self._semantic_cache_loaded:
+            return
+        self._semantic_cache_loaded = True
+
+        try:
+            cached = await get_cached_response(
+                DataSource.OPENAI, {"semantic_event_cache": SEMANTIC_CACHE_MODEL}
+            )
+            if not cached or not cached.get("events"):
+                return
+
+            embeddings = (
+                np.frombuffer(base64.b64decode(cached["embeddings"]), dtype=np.float16)
+                .astype(np.float32)
+                .reshape(len(cached["events"]), -1)
+            )
+            events = [
+                EnhancedEventInfo(event_id="", **event) for event in cached["events"]
+            ]
+        except Exception as e:
+            logger.warning(f"Error loading semantic event cache: {e}")
+            return
+
+        # Entries added before the load completed stay after the persisted ones
+        if self._semantic_count:
+            added_embeddings, added_events = self._semantic_cache_entries()
+            embeddings = np.vstack([embeddings, added_embeddings])
+            events = events + added_events
+
+        dirty = self._semantic_cache_dirty
+        self._semantic_embeddings = None
+        self._semantic_count = self._semantic_next = 0
+        for embedding, event in zip(
+            embeddings[-SEMANTIC_CACHE_MAX_ENTRIES:],
+            events[-SEMANTIC_CACHE_MAX_ENTRIES:],
+        ):
+            self._store_semantic_cache(embedding, event)
+        self._semantic_cache_dirty = dirty
+
+        logger.info(f"💾 Loaded {self._semantic_count} semantic event cache entries")
+
+    async def _save_semantic_cache(self, force: bool = False) -> None:
+        """Persist the newest semantic cache entries to Redis, throttled unless forced"""
+
+        if not self._semantic_cache_dirty or not self._semantic_count:
+            return
+        if (
+            not force
+            and time.monotonic() - self._semantic_cache_saved_at
+            < SEMANTIC_CACHE_SAVE_INTERVAL_SECONDS
+        ):
+            return
+
+        embeddings, events = self._semantic_cache_entries()
+        payload = {
+            "embeddings": base64.b64encode(
+                embeddings.astype(np.float16).tobytes()
+            ).decode("ascii"),
+            "events": [
+                {
+                    "event_type": event.event_type,
+                    "primary_entity": event.primary_entity,
+                    "secondary_entities": event.secondary_entities,
+                    "funding_info": event.funding_info,
+                    "product_info": event.product_info,
+                    "partnership_info": event.partnership_info,
+                    "location": event.location,
+                    "description": event.description,
+                    "key_phrases": event.key_phrases,
+                    "confidence_score": event.confidence_score,
+                }
+                for event in events
+            ],
+        }
+
+        try:
+            await cache_api_response(
+                DataSource.OPENAI,
+                {"semantic_event_cache": SEMANTIC_CACHE_MODEL},
+                payload,
+                SEMANTIC_CACHE_TTL_HOURS,
+            )
+            self._semantic_cache_dirty = False
+            self._semantic_cache_saved_at = time.monotonic()
+        except Exception as e:
+            logger.warning(f"Error persisting semantic event cache: {e}")
+
     async def _extract_enhanced_event_info(
         self, article: Dict[str, Any], event_id: str
     ) -> EnhancedEventInfo:
         """Extract comprehensive event information with relationship potential"""
 
+        # Near-duplicate articles reuse an earlier extraction instead of calling OpenAI
+        embedding = await self._embed_article(article)
+        if embedding is not None:
+            cached_event = self._lookup_semantic_cache(embedding, event_id)
+            if cached_event is not None:
+                return cached_event
+
         prompt = f"""
         Analyze this African AI/tech news article and extract comprehensive structured information.
         Focus on identifying entities, funding details, partnerships, and relationship indicators.
@@ -185,7 +711,9 @@ class AdvancedAIDeduplicationService:
         """
 
         try:
-            response = await self.client.chat.completions.create(
+            # Stream the reply and bound slow outliers so one stalled call
+            # cannot hold up the whole batch
+            response_content = await self._cached_chat(
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -197,37 +725,47 @@ class AdvancedAIDeduplicationService:
                 temperature=0.1,
                 max_tokens=800,
                 response_format={"type": "json_object"},
+                stream=True,
+                read_timeout=EXTRACTION_TIMEOUT_SECONDS,
             )
-
-            response_content = response.choices[0].message.content.strip()
             if not response_content:
                 raise ValueError("Empty response from OpenAI")
 
             try:
-                extracted_info = json.loads(response_content)
-            except json.JSONDecodeError as e:
+                extracted_info = ExtractedEventSchema.model_validate_json(
+                    response_content
+                )
+            except ValidationError as e:
                 logger.error(f"Invalid JSON response: {response_content[:200]}...")
                 raise e
 
             # Convert to EnhancedEventInfo object
             event = EnhancedEventInfo(
                 event_id=event_id,
-                event_type=extracted_info.get("event_type", "other"),
-                primary_entity=extracted_info.get("primary_entity", ""),
-                secondary_entities=extracted_info.get("secondary_entities", []),
-                funding_info=extracted_info.get("funding_info", {}),
-                product_info=extracted_info.get("product_info", {}),
-                partnership_info=extracted_info.get("partnership_info", {}),
-                location=extracted_info.get("location"),
-                description=extracted_info.get("description", ""),
-                key_phrases=extracted_info.get("key_phrases", []),
-                confidence_score=extracted_info.get("confidence", 0.5),
+                event_type=extracted_info.event_type,
+                primary_entity=extracted_info.primary_entity,
+                secondary_entities=extracted_info.secondary_entities,
+                funding_info=extracted_info.funding_info,
+                product_info=extracted_info.product_info,
+                partnership_info=extracted_info.partnership_info,
+                location=extracted_info.location,
+                description=extracted_info.description,
+                key_phrases=extracted_info.key_phrases,
+                confidence_score=extracted_info.confidence,
             )
 
+            if embedding is not None:
+                self._store_semantic_cache(embedding, event)
+
             return event
 
         except Exception as e:
-            logger.error(f"❌ Error extracting enhanced event information: {e}")
+            if isinstance(e, asyncio.TimeoutError):
+                logger.warning(
+                    f"⏱️ Event extraction timed out after {EXTRACTION_TIMEOUT_SECONDS}s"
+                )
+            else:
+                logger.error(f"❌ Error extracting enhanced event information: {e}")
             # Return basic event info as fallback
             return EnhancedEventInfo(
                 event_id=event_id,
@@ -242,88 +780,136 @@ class AdvancedAIDeduplicationService:
     ) -> List[EventRelationship]:
         """Identify relationships between events using AI analysis"""
 
-        relationships = []
+        # Quick filtering to avoid unnecessary AI calls
+        pairs = [
+            (events[i], events[j])
+            for i, j in await self._candidate_pairs(events)
+            if self._should_compare_events(events[i], events[j])
+        ]
 
-        # Compare each event with every other event
-        for i, event1 in enumerate(events):
-            for j, event2 in enumerate(events[i + 1 :], start=i + 1):
-                # Quick filtering to avoid unnecessary AI calls
-                if not self._should_compare_events(event1, event2):
-                    continue
+        # Classify pairs in batches of RELATIONSHIP_BATCH_SIZE per AI call,
+        # with all batches in flight concurrently
+        batches = [
+            pairs[i : i + RELATIONSHIP_BATCH_SIZE]
+            for i in range(0, len(pairs), RELATIONSHIP_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(
+                (
+                    self._analyze_event_relationships_batch(batch)
+                    if len(batch) > 1
+                    else self._analyze_single_pair(*batch[0])
+                )
+                for batch in batches
+            ),
+            return_exceptions=True,
+        )
 
-                try:
-                    relationship = await self._analyze_event_relationship(
-                        event1, event2
-                    )
-                    if (
-                        relationship
-                        and relationship.relationship_type != RelationshipType.NONE
-                    ):
-                        relationships.append(relationship)
-
-                        # Add reverse relationship if appropriate
-                        if relationship.relationship_type in [
-                            RelationshipType.RELATED_FUNDING,
-                            RelationshipType.PROGRAM_BENEFICIARIES,
-                        ]:
-                            reverse_relationship = EventRelationship(
-                                source_event_id=event2.event_id,
-                                target_event_id=event1.event_id,
-                                relationship_type=relationship.relationship_type,
-                                confidence=relationship.confidence,
-                                shared_entities=relationship.shared_entities,
-                                relationship_description=relationship.relationship_description,
-                            )
-                            relationships.append(reverse_relationship)
-
-                except Exception as e:
-                    logger.error(
-                        f"❌ Error analyzing relationship between {event1.event_id} and {event2.event_id}: {e}"
-                    )
-                    continue
+        relationships = []
+        for batch, batch_results in zip(batches, results):
+            if isinstance(batch_results, Exception):
+                logger.error(
+                    f"❌ Error analyzing relationships for {len(batch)} event pairs: {batch_results}"
+                )
+                continue
+
+            # Relationships are undirected: one edge covers both directions
+            for relationship in batch_results:
+                if (
+                    relationship
+                    and relationship.relationship_type != RelationshipType.NONE
+                ):
+                    relationships.append(relationship)
 
         return relationships
 
+    async def _analyze_single_pair(
+        self, event1: EnhancedEventInfo, event2: EnhancedEventInfo
+    ) -> List[Optional[EventRelationship]]:
+        """Analyze a lone pair with the single-pair prompt, shaped like a batch result"""
+
+        return [await self._analyze_event_relationship(event1, event2)]
+
+    async def _candidate_pairs(
+        self, events: List[EnhancedEventInfo]
+    ) -> List[Tuple[int, int]]:
+        """Restrict pairwise comparison to each event's nearest neighbours by embedding"""
+
+        n = len(events)
+        model = await self._get_embedding_model()
+        if model is None or n <= RELATIONSHIP_CANDIDATE_K + 1:
+            return [(i, j) for i in range(n) for j in range(i + 1, n)]
+
+        try:
+            embeddings = await asyncio.to_thread(
+                model.encode,
+                [f"{e.primary_entity} {e.description}" for e in events],
+                normalize_embeddings=True,
+            )
+        except Exception as e:
+            logger.warning(f"Error embedding events, comparing all pairs: {e}")
+            return [(i, j) for i in range(n) for j in range(i + 1, n)]
+
+        similarities = embeddings @ embeddings.T
+        np.fill_diagonal(similarities, -np.inf)
+        neighbours = np.argpartition(-similarities, RELATIONSHIP_CANDIDATE_K, axis=1)[
+            :, :RELATIONSHIP_CANDIDATE_K
+        ]
+
+        pairs = set()
+        for i, row in enumerate(neighbours):
+            for j in row:
+                j = int(j)
+                pairs.add((min(i, j), max(i, j)))
+
+        return sorted(pairs)
+
     def _should_compare_events(
         self, event1: EnhancedEventInfo, event2: EnhancedEventInfo
     ) -> bool:
         """Quick filter to determine if two events should be compared for relationships"""
 
+        # Cheapest equality checks run first; the set test runs last
+
         # Always compare if same primary entity
-        if (
-            event1.primary_entity
-            and event2.primary_entity
-            and event1.primary_entity.lower() == event2.primary_entity.lower()
-        ):
+        if event1._lc_primary and event1._lc_primary == event2._lc_primary:
             return True
 
-        # Compare if share secondary entities
-        if set(entity.lower() for entity in event1.secondary_entities) & set(
-            entity.lower() for entity in event2.secondary_entities
-        ):
+        # Compare if same location
+        if event1._lc_location and event1._lc_location == event2._lc_location:
             return True
 
         # Compare funding events if they mention similar programs or investors
         if event1.event_type == "funding" and event2.event_type == "funding":
-            investor1 = (event1.funding_info.get("investor") or "").lower()
-            investor2 = (event2.funding_info.get("investor") or "").lower()
-            program1 = (event1.funding_info.get("program") or "").lower()
-            program2 = (event2.funding_info.get("program") or "").lower()
-
-            if (investor1 and investor2 and investor1 == investor2) or (
-                program1 and program2 and program1 == program2
+            if (event1._lc_investor and event1._lc_investor == event2._lc_investor) or (
+                event1._lc_program and event1._lc_program == event2._lc_program
             ):
                 return True
 
-        # Compare if same location and similar timeframe
-        if (
-            event1.location
-            and event2.location
-            and event1.location.lower() == event2.location.lower()
-        ):
-            return True
+        # Compare if share secondary entities (stops at the first common entity)
+        return bool(
+            event1._lc_secondaries
+            and event2._lc_secondaries
+            and not event1._lc_secondaries.isdisjoint(event2._lc_secondaries)
+        )
 
-        return False
+    @staticmethod
+    def _compact_event(event: EnhancedEventInfo) -> str:
+        """Serialize the structured fields of an event for a relationship prompt"""
+
+        funding_info = event.funding_info or {}
+        return orjson.dumps(
+            {
+                "type": event.event_type,
+                "entity": event.primary_entity,
+                "secondary": event.secondary_entities,
+                "investor": funding_info.get("investor"),
+                "program": funding_info.get("program"),
+                "round": funding_info.get("round"),
+                "amount": funding_info.get("amount"),
+                "desc": event.description[:200],
+            }
+        ).decode()
 
     async def _analyze_event_relationship(
         self, event1: EnhancedEventInfo, event2: EnhancedEventInfo
@@ -334,20 +920,10 @@ class AdvancedAIDeduplicationService:
         Analyze the relationship between these two African AI/tech news events.
         Determine if they are related and how.
         
-        EVENT 1:
-        Type: {event1.event_type}
-        Primary Entity: {event1.primary_entity}
-        Secondary Entities: {event1.secondary_entities}
-        Funding Info: {event1.funding_info}
-        Description: {event1.description}
-        
-        EVENT 2:
-        Type: {event2.event_type}
-        Primary Entity: {event2.primary_entity}
-        Secondary Entities: {event2.secondary_entities}
-        Funding Info: {event2.funding_info}
-        Description: {event2.description}
-        
+        EVENT 1: {self._compact_event(event1)}
+
+        EVENT 2: {self._compact_event(event2)}
+
         Analysis Focus:
         1. Are these the SAME event reported by different sources?
         2. Are these DIFFERENT companies funded by the same program/investor?
@@ -360,14 +936,14 @@ class AdvancedAIDeduplicationService:
             "relationship_type": "same_event|related_funding|sequential_funding|program_beneficiaries|related_partnership|ecosystem_related|none",
             "confidence": 0.0-1.0,
             "shared_entities": ["entity1", "entity2"],
-            "relationship_description": "detailed explanation of the relationship",
+            "relationship_description": "brief explanation of the relationship",
             "supporting_evidence": ["evidence1", "evidence2"],
             "key_differences": ["difference1", "difference2"] or []
         }}
         """
 
         try:
-            response = await self.client.chat.completions.create(
+            response_content = await self._cached_chat(
                 model="gpt-4o-mini",
                 messages=[
                     {
@@ -377,80 +953,177 @@ class AdvancedAIDeduplicationService:
                     {"role": "user", "content": prompt},
                 ],
                 temperature=0.1,
-                max_tokens=500,
+                max_tokens=300,
                 response_format={"type": "json_object"},
             )
-
-            response_content = response.choices[0].message.content.strip()
             if not response_content:
                 raise ValueError("Empty response from OpenAI")
 
             try:
-                analysis = json.loads(response_content)
-            except json.JSONDecodeError as e:
+                analysis = RelationshipSchema.model_validate_json(response_content)
+            except ValidationError as e:
                 logger.error(f"Invalid JSON response: {response_content[:200]}...")
                 raise e
 
-            relationship_type_str = analysis.get("relationship_type", "none")
-            try:
-                relationship_type = RelationshipType(relationship_type_str)
-            except ValueError:
-                relationship_type = RelationshipType.NONE
-
-            if (
-                relationship_type == RelationshipType.NONE
-                or analysis.get("confidence", 0) < 0.4
-            ):
-                return None
-
-            return EventRelationship(
-                source_event_id=event1.event_id,
-                target_event_id=event2.event_id,
-                relationship_type=relationship_type,
-                confidence=analysis.get("confidence", 0.5),
-                shared_entities=analysis.get("shared_entities", []),
-                relationship_description=analysis.get("relationship_description", ""),
-                metadata={
-                    "supporting_evidence": analysis.get("supporting_evidence", []),
-                    "key_differences": analysis.get("key_differences", []),
-                },
-            )
+            return self._build_relationship(event1, event2, analysis)
 
         except Exception as e:
             logger.error(f"❌ Error in AI relationship analysis: {e}")
             return None
 
+    def _build_relationship(
+        self,
+        event1: EnhancedEventInfo,
+        event2: EnhancedEventInfo,
+        analysis: RelationshipSchema,
+    ) -> Optional[EventRelationship]:
+        """Convert one AI relationship analysis into an EventRelationship"""
+
+        if (
+            analysis.relationship_type == RelationshipType.NONE
+            or analysis.confidence < 0.4
+        ):
+            return None
+
+        return EventRelationship(
+            source_event_id=event1.event_id,
+            target_event_id=event2.event_id,
+            relationship_type=analysis.relationship_type,
+            confidence=analysis.confidence,
+            shared_entities=analysis.shared_entities,
+            relationship_description=analysis.relationship_description,
+            metadata={
+                "supporting_evidence": analysis.supporting_evidence,
+                "key_differences": analysis.key_differences,
+            },
+        )
+
+    async def _analyze_event_relationships_batch(
+        self, pairs: List[Tuple[EnhancedEventInfo, EnhancedEventInfo]]
+    ) -> List[Optional[EventRelationship]]:
+        """Use one AI call to classify the relationships of several event pairs"""
+
+        pair_blocks = "\n".join(f"""
+        PAIR {idx}:
+        EVENT A: {self._compact_event(event1)}
+        EVENT B: {self._compact_event(event2)}
+""" for idx, (event1, event2) in enumerate(pairs))
+
+        prompt = f"""
+        Analyze the relationship within each of these pairs of African AI/tech news events.
+        For every pair, determine if the two events are related and how.
+        {pair_blocks}
+        Analysis Focus for each pair:
+        1. Are these the SAME event reported by different sources?
+        2. Are these DIFFERENT companies funded by the same program/investor?
+        3. Are these DIFFERENT funding rounds for the same company?
+        4. Are these related to the same partnership or program?
+        5. Are they part of the same ecosystem but unrelated events?
+
+        Respond in JSON format with one result per pair:
+        {{
+            "results": [
+                {{
+                    "pair_idx": 0,
+                    "relationship_type": "same_event|related_funding|sequential_funding|program_beneficiaries|related_partnership|ecosystem_related|none",
+                    "confidence": 0.0-1.0,
+                    "shared_entities": ["entity1", "entity2"],
+                    "relationship_description": "brief explanation of the relationship",
+                    "supporting_evidence": ["evidence1", "evidence2"],
+                    "key_differences": ["difference1", "difference2"] or []
+                }}
+            ]
+        }}
+        """
+
+        relationships: List[Optional[EventRelationship]] = [None] * len(pairs)
+
+        try:
+            response_content = await self._cached_chat(
+                model="gpt-4o-mini",
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert at identifying relationships between African tech/AI news events. Be precise about relationship types.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.1,
+                max_tokens=300 * len(pairs),
+                response_format={"type": "json_object"},
+            )
+            if not response_content:
+                raise ValueError("Empty response from OpenAI")
+
+            try:
+                analysis = RelationshipBatchSchema.model_validate_json(response_content)
+            except ValidationError as e:
+                logger.error(f"Invalid JSON response: {response_content[:200]}...")
+                raise e
+
+            for entry in analysis.results:
+                try:
+                    result = RelationshipSchema.model_validate(entry)
+                except ValidationError as e:
+                    logger.warning(f"Skipping invalid relationship entry: {e}")
+                    continue
+
+                idx = result.pair_idx
+                if idx is not None and 0 <= idx < len(pairs):
+                    event1, event2 = pairs[idx]
+                    relationships[idx] = self._build_relationship(
+                        event1, event2, result
+                    )
+
+        except Exception as e:
+            logger.error(f"❌ Error in batched AI relationship analysis: {e}")
+
+        return relationships
+
     async def _create_event_clusters(
         self, events: List[EnhancedEventInfo], relationships: List[EventRelationship]
     ) -> Tuple[List[EventCluster], List[EnhancedEventInfo]]:
         """Create clusters of related events"""
 
-        # Build relationship graph
-        relationship_graph = {}
-        for rel in relationships:
-            if rel.source_event_id not in relationship_graph:
-                relationship_graph[rel.source_event_id] = []
-            relationship_graph[rel.source_event_id].append(rel)
+        # Union-find over event ids: each relationship merges its two events
+        parent = {e.event_id: e.event_id for e in events}
 
-        # Find connected components (clusters)
-        visited = set()
-        clusters = []
-        standalone_events = []
+        def find(event_id: str) -> str:
+            root = event_id
+            while parent[root] != root:
+                root = parent[root]
+            # Path compression
+            while parent[event_id] != root:
+                parent[event_id], event_id = root, parent[event_id]
+            return root
 
+        for rel in relationships:
+            if rel.source_event_id in parent and rel.target_event_id in parent:
+                source_root = find(rel.source_event_id)
+                target_root = find(rel.target_event_id)
+                if source_root != target_root:
+                    parent[target_root] = source_root
+
+        # Group events by component root, preserving input order
+        components: Dict[str, List[EnhancedEventInfo]] = defaultdict(list)
         for event in events:
-            if event.event_id in visited:
-                continue
+            components[find(event.event_id)].append(event)
 
-            # Find all events connected to this one
-            cluster_events = []
-            self._dfs_find_cluster(
-                event.event_id, relationship_graph, visited, cluster_events, events
-            )
+        # Bucket relationships by component root once, instead of rescanning
+        # every relationship per cluster
+        relationships_by_root: Dict[str, List[EventRelationship]] = defaultdict(list)
+        for rel in relationships:
+            if rel.source_event_id in parent and rel.target_event_id in parent:
+                relationships_by_root[find(rel.source_event_id)].append(rel)
+
+        clusters = []
+        standalone_events = []
 
+        for root, cluster_events in components.items():
             if len(cluster_events) > 1:
                 # Create cluster
                 cluster = await self._create_cluster_from_events(
-                    cluster_events, relationships
+                    cluster_events, relationships_by_root.get(root, [])
                 )
                 clusters.append(cluster)
             else:
@@ -459,66 +1132,21 @@ class AdvancedAIDeduplicationService:
 
         return clusters, standalone_events
 
-    def _dfs_find_cluster(
-        self,
-        event_id: str,
-        relationship_graph: Dict[str, List[EventRelationship]],
-        visited: Set[str],
-        cluster_events: List[EnhancedEventInfo],
-        all_events: List[EnhancedEventInfo],
-    ):
-        """DFS to find all events in a cluster"""
-
-        if event_id in visited:
-            return
-
-        visited.add(event_id)
-
-        # Find the event object
-        event_obj = next((e for e in all_events if e.event_id == event_id), None)
-        if event_obj:
-            cluster_events.append(event_obj)
-
-        # Visit connected events
-        if event_id in relationship_graph:
-            for relationship in relationship_graph[event_id]:
-                self._dfs_find_cluster(
-                    relationship.target_event_id,
-                    relationship_graph,
-                    visited,
-                    cluster_events,
-                    all_events,
-                )
-
     async def _create_cluster_from_events(
         self,
         events: List[EnhancedEventInfo],
-        all_relationships: List[EventRelationship],
+        cluster_relationships: List[EventRelationship],
     ) -> EventCluster:
-        """Create a cluster object from related events"""
-
-        # Find relationships within this cluster
-        event_ids = {e.event_id for e in events}
-        cluster_relationships = [
-            r
-            for r in all_relationships
-            if r.source_event_id in event_ids and r.target_event_id in event_ids
-        ]
+        """Create a cluster object from related events and their relationships"""
 
-        # Determine cluster type and primary entity
-        cluster_type = await self._determine_cluster_type(events, cluster_relationships)
-        primary_entity = await self._determine_primary_entity(
+        # Determine cluster type, primary entity and relationship summary
+        cluster_type, primary_entity, relationship_summary = self._summarize_cluster(
             events, cluster_relationships
         )
 
         # Select canonical event (best representative)
         canonical_event = self._select_canonical_event(events)
 
-        # Generate relationship summary
-        relationship_summary = await self._generate_relationship_summary(
-            events, cluster_relationships
-        )
-
         # Calculate total impact
         total_impact = self._calculate_cluster_impact(events)
 
@@ -538,107 +1166,60 @@ class AdvancedAIDeduplicationService:
 
         return cluster
 
-    async def _determine_cluster_type(
-        self, events: List[EnhancedEventInfo], relationships: List[EventRelationship]
-    ) -> str:
-        """Determine the type of cluster based on events and relationships"""
-
-        relationship_types = [r.relationship_type for r in relationships]
-
+    # Cluster types in priority order, keyed by the relationship that implies them
+    _CLUSTER_TYPE_PRIORITY = (
         # Funding program cluster (multiple companies funded by same source)
-        if (
-            RelationshipType.RELATED_FUNDING in relationship_types
-            or RelationshipType.PROGRAM_BENEFICIARIES in relationship_types
-        ):
-            return "funding_program"
-
+        (RelationshipType.RELATED_FUNDING, "funding_program"),
+        (RelationshipType.PROGRAM_BENEFICIARIES, "funding_program"),
         # Company journey cluster (same company, multiple events)
-        if RelationshipType.SEQUENTIAL_FUNDING in relationship_types:
-            return "company_journey"
-
+        (RelationshipType.SEQUENTIAL_FUNDING, "company_journey"),
         # Partnership network cluster
-        if RelationshipType.RELATED_PARTNERSHIP in relationship_types:
-            return "partnership_network"
-
+        (RelationshipType.RELATED_PARTNERSHIP, "partnership_network"),
         # Duplicate event cluster (same event, multiple sources)
-        if RelationshipType.SAME_EVENT in relationship_types:
-            return "duplicate_event"
-
-        # Ecosystem cluster
-        return "ecosystem_related"
+        (RelationshipType.SAME_EVENT, "duplicate_event"),
+    )
 
-    async def _determine_primary_entity(
+    def _summarize_cluster(
         self, events: List[EnhancedEventInfo], relationships: List[EventRelationship]
-    ) -> str:
-        """Determine the primary entity for the cluster"""
-
-        # Count entity mentions
-        entity_counts = {}
+    ) -> Tuple[str, str, str]:
+        """Determine cluster type, primary entity and relationship summary in one pass"""
+
+        relationship_counts = Counter(r.relationship_type for r in relationships)
+
+        # Cluster type from the highest-priority relationship present
+        cluster_type = next(
+            (
+                cluster_type
+                for relationship_type, cluster_type in self._CLUSTER_TYPE_PRIORITY
+                if relationship_type in relationship_counts
+            ),
+            # Ecosystem cluster
+            "ecosystem_related",
+        )
 
+        # Count entity mentions, weighting primary entities higher
+        entity_counts = Counter()
         for event in events:
-            # Count primary entity
-            if event.primary_entity:
-                primary = event.primary_entity.lower()
-                entity_counts[primary] = (
-                    entity_counts.get(primary, 0) + 2
-                )  # Higher weight for primary
-
-            # Count secondary entities
-            for secondary in event.secondary_entities:
-                sec = secondary.lower()
-                entity_counts[sec] = entity_counts.get(sec, 0) + 1
+            if event._lc_primary:
+                entity_counts[event._lc_primary] += 2
+            entity_counts.update(
+                secondary.lower() for secondary in event.secondary_entities
+            )
 
-        # Return most mentioned entity
         if entity_counts:
-            return max(entity_counts, key=entity_counts.get).title()
-
-        return events[0].primary_entity if events else "Unknown"
-
-    def _select_canonical_event(
-        self, events: List[EnhancedEventInfo]
-    ) -> EnhancedEventInfo:
-        """Select the best event to represent the cluster"""
-
-        # Score events based on multiple factors
-        scored_events = []
-
-        for event in events:
-            score = 0
-
-            # Confidence score
-            score += event.confidence_score * 20
-
-            # Description completeness
-            score += min(len(event.description) / 50, 10)
-
-            # Number of entities (indicates comprehensiveness)
-            score += len(event.secondary_entities) * 2
-
-            # Funding events get priority if they have amount info
-            if event.event_type == "funding" and event.funding_info.get("amount"):
-                score += 15
-
-            # Events with location info get bonus
-            if event.location:
-                score += 5
-
-            scored_events.append((event, score))
-
-        # Return highest scoring event
-        return max(scored_events, key=lambda x: x[1])[0]
-
-    async def _generate_relationship_summary(
-        self, events: List[EnhancedEventInfo], relationships: List[EventRelationship]
-    ) -> str:
-        """Generate a summary of relationships in the cluster"""
-
-        if not relationships:
-            return f"Cluster of {len(events)} related events"
+            primary_entity = entity_counts.most_common(1)[0][0].title()
+        else:
+            primary_entity = events[0].primary_entity if events else "Unknown"
+
+        # Summarize by the most common relationship
+        if not relationship_counts:
+            return (
+                cluster_type,
+                primary_entity,
+                f"Cluster of {len(events)} related events",
+            )
 
-        relationship_types = [r.relationship_type.value for r in relationships]
-        most_common_relationship = max(
-            set(relationship_types), key=relationship_types.count
-        )
+        most_common_relationship = relationship_counts.most_common(1)[0][0].value
 
         summaries = {
             "related_funding": f"Multiple companies funded by the same source: {len(events)} funding events",
@@ -649,58 +1230,82 @@ class AdvancedAIDeduplicationService:
             "ecosystem_related": f"Ecosystem cluster: {len(events)} related events",
         }
 
-        return summaries.get(
+        relationship_summary = summaries.get(
             most_common_relationship, f"Related events cluster: {len(events)} events"
         )
 
+        return cluster_type, primary_entity, relationship_summary
+
+    def _select_canonical_event(
+        self, events: List[EnhancedEventInfo]
+    ) -> EnhancedEventInfo:
+        """Select the best event to represent the cluster"""
+
+        def score(event: EnhancedEventInfo) -> float:
+            return (
+                # Confidence score
+                event.confidence_score * 20
+                # Description completeness
+                + min(len(event.description) / 50, 10)
+                # Number of entities (indicates comprehensiveness)
+                + len(event.secondary_entities) * 2
+                # Funding events get priority if they have amount info
+                + (
+                    15
+                    if event.event_type == "funding"
+                    and event.funding_info.get("amount")
+                    else 0
+                )
+                # Events with location info get bonus
+                + (5 if event.location else 0)
+            )
+
+        # Return highest scoring event
+        return max(events, key=score)
+
     def _calculate_cluster_impact(
         self, events: List[EnhancedEventInfo]
     ) -> Dict[str, Any]:
         """Calculate aggregated impact metrics for the cluster"""
 
-        impact = {
-            "total_events": len(events),
-            "event_types": {},
-            "funding_total": 0,
-            "companies_involved": set(),
-            "locations": set(),
-            "sectors": set(),
-        }
+        # Count event types
+        event_types = Counter(event.event_type for event in events)
 
-        for event in events:
-            # Count event types
-            event_type = event.event_type
-            impact["event_types"][event_type] = (
-                impact["event_types"].get(event_type, 0) + 1
-            )
+        funding_amounts = []
+        companies_involved = set()
+        locations = set()
+        sectors = set()
 
-            # Sum funding amounts
+        for event in events:
+            # Collect funding amounts
             if event.funding_info.get("amount_usd"):
                 try:
-                    amount = float(event.funding_info["amount_usd"])
-                    impact["funding_total"] += amount
+                    funding_amounts.append(float(event.funding_info["amount_usd"]))
                 except (ValueError, TypeError, KeyError):
                     pass
 
             # Collect entities
             if event.primary_entity:
-                impact["companies_involved"].add(event.primary_entity)
-            impact["companies_involved"].update(event.secondary_entities)
+                companies_involved.add(event.primary_entity)
+            companies_involved.update(event.secondary_entities)
 
             # Collect locations
             if event.location:
-                impact["locations"].add(event.location)
+                locations.add(event.location)
 
             # Collect sectors
             if event.product_info.get("category"):
-                impact["sectors"].add(event.product_info["category"])
+                sectors.add(event.product_info["category"])
 
         # Convert sets to lists for JSON serialization
-        impact["companies_involved"] = list(impact["companies_involved"])
-        impact["locations"] = list(impact["locations"])
-        impact["sectors"] = list(impact["sectors"])
-
-        return impact
+        return {
+            "total_events": len(events),
+            "event_types": dict(event_types),
+            "funding_total": sum(funding_amounts),
+            "companies_involved": list(companies_involved),
+            "locations": list(locations),
+            "sectors": list(sectors),
+        }
 
 
 # Global advanced AI deduplication service instance
@@ -730,22 +1335,33 @@ async def analyze_articles_with_complex_relationships(
         "total_relationships": 0,
     }
 
+    # Lowercase article text once, then resolve each distinct entity to the
+    # first article that mentions it
+    article_texts = [
+        (article.get("title", "").lower(), article.get("snippet", "").lower())
+        for article in articles
+    ]
+    entity_to_article: Dict[str, Optional[int]] = {}
+
+    def find_article_index(entity: str) -> Optional[int]:
+        if entity not in entity_to_article:
+            entity_to_article[entity] = next(
+                (
+                    i
+                    for i, (title, snippet) in enumerate(article_texts)
+                    if entity in title or entity in snippet
+                ),
+                None,
+            )
+        return entity_to_article[entity]
+
     # Process clusters
     for cluster in clusters:
         # Convert canonical event back to article format
-        canonical_article = None
-        for article in articles:
-            # Find original article that matches canonical event
-            if (
-                cluster.canonical_event.primary_entity.lower()
-                in article.get("title", "").lower()
-                or cluster.canonical_event.primary_entity.lower()
-                in article.get("snippet", "").lower()
-            ):
-                canonical_article = article.copy()
-                break
+        article_index = find_article_index(cluster.canonical_event._lc_primary)
 
-        if canonical_article:
+        if article_index is not None:
+            canonical_article = articles[article_index].copy()
             # Add cluster metadata
             canonical_article["cluster_info"] = {
                 "cluster_id": cluster.cluster_id,
@@ -772,13 +1388,9 @@ async def analyze_articles_with_complex_relationships(
     # Add standalone events
     for event in standalone_events:
         # Find original article
-        for article in articles:
-            if (
-                event.primary_entity.lower() in article.get("title", "").lower()
-                or event.primary_entity.lower() in article.get("snippet", "").lower()
-            ):
-                canonical_articles.append(article)
-                break
+        article_index = find_article_index(event._lc_primary)
+        if article_index is not None:
+            canonical_articles.append(articles[article_index])
 
     # Count total relationships
     relationship_metadata["total_relationships"] = sum(
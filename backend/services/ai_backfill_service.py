@@ -11,27 +11,280 @@ This service runs scheduled jobs to backfill missing data for existing innovatio
 """
 
 import asyncio
+import functools
+import hashlib
+import heapq
+import itertools
 import json
+import random
 import re
+import time
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
-from enum import Enum
-from typing import Any, Dict, List, Optional
+from enum import Enum, IntEnum
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
+import aiohttp
+import httpx
 import openai
+import orjson
+import redis.asyncio as aioredis
+from aiolimiter import AsyncLimiter
 from config.settings import settings
 from etl.intelligence.perplexity_african_ai import PerplexityAfricanAIModule
 from loguru import logger
 from services.serper_service import SerperService
+from services.unified_cache import (
+    DataSource,
+    cache_api_response,
+    cache_null_response,
+    get_cached_response,
+    is_null_cached,
+    unified_cache,
+)
+
+# Parse requests coalesced into one OpenAI call, and how long to wait to fill a batch
+OPENAI_PARSE_BATCH_SIZE = 8
+OPENAI_PARSE_BATCH_WINDOW_SECONDS = 0.05
+OPENAI_MAX_ATTEMPTS = 5
+# Longest backoff between OpenAI retries after a rate limit, in seconds
+OPENAI_MAX_BACKOFF_SECONDS = 60
+# Keep idle OpenAI connections open across a Perplexity generation (httpx default is 5s)
+OPENAI_KEEPALIVE_SECONDS = 75.0
+
+# In-flight request caps per upstream, alongside each upstream's per-minute limiter
+PERPLEXITY_MAX_CONCURRENCY = 4
+SERPER_MAX_CONCURRENCY = 8
+OPENAI_MAX_CONCURRENCY = 8
+
+# Perplexity confidence at which a combined lookup skips waiting for Serper
+SPECULATIVE_CONFIDENCE_THRESHOLD = 0.85
+
+# Consecutive upstream failures that open a circuit, and how long it stays open
+CIRCUIT_FAIL_MAX = 5
+CIRCUIT_RESET_SECONDS = 60
+
+# Durable job queue: a ZSET of job ids scored by (priority, created_at), plus
+# one JSON document per job. Claimed jobs move to a ZSET scored by claim time and
+# keep their document until processed; claims older than the timeout are requeued.
+# Each innovation maps to its latest job id, so it is queued at most once
+BACKFILL_QUEUE_KEY = "backfill:pending"
+BACKFILL_IN_PROGRESS_KEY = "backfill:in_progress"
+BACKFILL_JOB_KEY_PREFIX = "backfill:job:"
+BACKFILL_INNOVATION_KEY_PREFIX = "backfill:innovation:"
+BACKFILL_CLAIM_TIMEOUT_SECONDS = 3600
+# Job documents and innovation entries expire if never processed or cancelled
+BACKFILL_JOB_TTL_SECONDS = 7 * 24 * 3600
+
+# Atomically queue a job unless its innovation already has one pending or in
+# progress, returning 1 when queued (0 when skipped) and the queue depth
+_ENQUEUE_JOB_SCRIPT = """
+local existing = redis.call('GET', KEYS[4])
+if existing and (redis.call('ZSCORE', KEYS[1], existing)
+        or redis.call('ZSCORE', KEYS[2], existing)) then
+    return {0, redis.call('ZCARD', KEYS[1])}
+end
+redis.call('SET', KEYS[3], ARGV[3], 'EX', ARGV[4])
+redis.call('SET', KEYS[4], ARGV[1], 'EX', ARGV[4])
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+return {1, redis.call('ZCARD', KEYS[1])}
+"""
 
+# Atomically move the most urgent pending job id to the in-progress set,
+# returning the id ("" when the queue is empty) and the remaining queue depth
+_CLAIM_JOB_SCRIPT = """
+local popped = redis.call('ZPOPMIN', KEYS[1])
+local job_id = ''
+if #popped > 0 then
+    job_id = popped[1]
+    redis.call('ZADD', KEYS[2], ARGV[1], job_id)
+end
+return {job_id, redis.call('ZCARD', KEYS[1])}
+"""
 
-class BackfillPriority(Enum):
-    """Priority levels for backfill operations"""
+# Search-result extraction patterns, compiled once. Each funding alternative
+# captures (amount, unit), so one scan covers every phrasing
+_AMOUNT = r"\$?(\d+(?:\.\d+)?)\s*(million|billion|M|B)"
+_FUNDING_RE = re.compile(
+    rf"raised\s+{_AMOUNT}"
+    rf"|funding\s+of\s+{_AMOUNT}"
+    r"|\$(\d+(?:\.\d+)?)\s*(million|billion|M|B)\s+in\s+funding"
+    rf"|series\s+[A-Z]\s+of\s+{_AMOUNT}",
+    re.IGNORECASE,
+)
+_WEBSITE_RE = re.compile(r"https?://(?:www\.)?([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})")
+_GITHUB_RE = re.compile(r"github\.com/([a-zA-Z0-9.-]+/[a-zA-Z0-9.-]+)")
+_COMPANY_RE = re.compile(r"(?:company|startup|founded)\s+([A-Z][a-zA-Z\s]+)")
+
+
+# Perplexity prompts per field type, filled in with str.format. The prompt text
+# is part of the Perplexity cache key, so changing it invalidates cached answers.
+_PERPLEXITY_BASE_PROMPT = """
+        Please share data publicly available on the AI innovation "{title}".
+        
+        Innovation Description: {description}
+        
+        I specifically need information about: {field_name}
+        """
+_PERPLEXITY_PROMPTS = {
+    "funding": _PERPLEXITY_BASE_PROMPT
+    + """
+            
+            Please focus on:
+            - Funding amounts raised (with currency)
+            - Investment rounds (seed, Series A, B, etc.)
+            - Investor names and organizations
+            - Funding dates and announcements
+            - Valuation information if available
+            
+            Provide specific, verifiable details with sources when possible.
+            """,
+    "contact": _PERPLEXITY_BASE_PROMPT
+    + """
+            
+            Please focus on:
+            - Company/organization name and official details
+            - Founding team and key personnel
+            - Official contact information
+            - Company registration details
+            - Location and headquarters information
+            
+            Provide verified, publicly available information only.
+            """,
+    "team": _PERPLEXITY_BASE_PROMPT
+    + """
+            
+            Please focus on:
+            - Founders and co-founders
+            - Key team members and their roles
+            - Leadership team information
+            - Technical team leads
+            - Advisory board members
+            
+            Include names, titles, and background information when available.
+            """,
+    "urls": _PERPLEXITY_BASE_PROMPT
+    + """
+            
+            Please focus on finding:
+            - Official website URL
+            - GitHub repository links
+            - Demo or product URLs
+            - Social media profiles
+            - App store links
+            
+            Verify that URLs are current and accessible.
+            """,
+    "metrics": _PERPLEXITY_BASE_PROMPT
+    + """
+            
+            Please focus on:
+            - User metrics (active users, downloads, etc.)
+            - Revenue information if publicly disclosed
+            - Growth metrics and milestones
+            - Market traction indicators
+            - Impact metrics and social outcomes
+            
+            Provide quantifiable data with sources when possible.
+            """,
+    "market_data": _PERPLEXITY_BASE_PROMPT
+    + """
+            
+            Please focus on:
+            - Total Addressable Market (TAM) size and projections
+            - Serviceable Addressable Market (SAM) estimates  
+            - Serviceable Obtainable Market (SOM) potential
+            - Market growth rates and trends
+            - Competitive landscape and market position
+            - Revenue models and monetization strategies
+            - Customer segments and market penetration
+            - Industry analysis and sector-specific data
+            
+            Provide specific market size figures in billions/millions with currency.
+            Include growth percentages and market projections when available.
+            """,
+}
+_PERPLEXITY_DEFAULT_PROMPT = (
+    _PERPLEXITY_BASE_PROMPT
+    + "\nPlease provide detailed, factual information about {field_name}."
+)
+
+# Serper queries per field type, with URL fields keyed by field name
+_SERPER_QUERIES = {
+    "funding": '"{name}" AND (funding OR investment OR "raised" OR "million" OR "series")',
+    "contact": '"{name}" AND (company OR organization OR founded OR headquarters)',
+    "team": '"{name}" AND (founder OR "founded by" OR team OR CEO)',
+    "metrics": '"{name}" AND (users OR customers OR downloads OR revenue)',
+    "market_data": '"{name}" AND (market size OR TAM OR SAM OR "billion market" OR "market opportunity")',
+}
+_SERPER_URL_QUERIES = {
+    "website_url": '"{name}" AND (website OR "official site" OR domain)',
+    "github_url": '"{name}" AND (github OR repository OR "open source")',
+    "demo_url": '"{name}" AND (demo OR "try it" OR "live app")',
+}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+
+class _CircuitBreaker:
+    """Fails calls to an upstream fast after repeated consecutive failures"""
+
+    def __init__(
+        self,
+        name: str,
+        fail_max: int = CIRCUIT_FAIL_MAX,
+        reset_timeout: float = CIRCUIT_RESET_SECONDS,
+    ):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def current_state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def check(self):
+        """Raise CircuitOpenError unless a call may go through"""
+
+        state = self.current_state
+        if state == "open":
+            raise CircuitOpenError(f"{self.name} circuit is open")
+        if state == "half-open":
+            # Let one trial call through; the rest wait for its outcome
+            self.opened_at = time.monotonic()
+
+    def record_success(self):
+        if self.opened_at is not None:
+            logger.info(f"✅ {self.name} circuit closed")
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.fail_max:
+            if self.opened_at is None:
+                logger.warning(
+                    f"⚠️ {self.name} circuit opened after {self.failures} consecutive failures"
+                )
+            self.opened_at = time.monotonic()
+
+
+class BackfillPriority(IntEnum):
+    """Priority levels for backfill operations, most urgent first"""
 
-    CRITICAL = "critical"  # Missing funding, basic company info
-    HIGH = "high"  # Missing contact info, key team members
-    MEDIUM = "medium"  # Missing social media, detailed metrics
-    LOW = "low"  # Missing nice-to-have information
+    CRITICAL = 0  # Missing funding, basic company info
+    HIGH = 1  # Missing contact info, key team members
+    MEDIUM = 2  # Missing social media, detailed metrics
+    LOW = 3  # Missing nice-to-have information
 
 
 class BackfillStatus(Enum):
@@ -44,7 +297,7 @@ class BackfillStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MissingField:
     """Represents a missing field that needs backfilling"""
 
@@ -55,7 +308,62 @@ class MissingField:
     estimated_cost: float  # API cost estimate
 
 
-@dataclass
+# Missing field detectors, in report order. MissingField is frozen, so the
+# same instances are shared by every job that needs them.
+_FIELD_SPECS: Tuple[Tuple[Callable[[Dict[str, Any]], bool], MissingField], ...] = (
+    # Critical missing fields
+    (
+        lambda innovation: not innovation.get("fundings"),
+        MissingField(
+            "funding_amount", "funding", BackfillPriority.CRITICAL, "perplexity", 0.10
+        ),
+    ),
+    (
+        lambda innovation: not innovation.get("website_url"),
+        MissingField("website_url", "urls", BackfillPriority.CRITICAL, "serper", 0.05),
+    ),
+    # High priority missing fields
+    (
+        lambda innovation: not innovation.get("organizations"),
+        MissingField(
+            "founding_organization", "contact", BackfillPriority.HIGH, "combined", 0.15
+        ),
+    ),
+    (
+        lambda innovation: not innovation.get("individuals"),
+        MissingField(
+            "key_team_members", "team", BackfillPriority.HIGH, "perplexity", 0.08
+        ),
+    ),
+    # Medium priority missing fields
+    (
+        lambda innovation: not innovation.get("github_url"),
+        MissingField("github_url", "urls", BackfillPriority.MEDIUM, "serper", 0.03),
+    ),
+    (
+        lambda innovation: not (innovation.get("impact_metrics") or {}).get(
+            "users_reached"
+        ),
+        MissingField(
+            "user_metrics", "metrics", BackfillPriority.MEDIUM, "perplexity", 0.07
+        ),
+    ),
+    # Market sizing data - High priority for comprehensive innovation profiles
+    (
+        lambda innovation: not innovation.get("market_sizing"),
+        MissingField(
+            "market_sizing", "market_data", BackfillPriority.HIGH, "perplexity", 0.12
+        ),
+    ),
+    # Low priority missing fields
+    (
+        lambda innovation: not innovation.get("demo_url"),
+        MissingField("demo_url", "urls", BackfillPriority.LOW, "serper", 0.02),
+    ),
+)
+
+
+@dataclass(slots=True)
 class BackfillJob:
     """Represents a backfill job for an innovation"""
 
@@ -72,9 +380,69 @@ class BackfillJob:
     total_cost: float = 0.0
     results: Dict[str, Any] = None
     error_message: Optional[str] = None
+    estimated_total_cost: float = 0.0  # sum of missing field cost estimates
+
+
+# Queued jobs store field names only; the shared MissingFields are looked up on claim
+_MISSING_FIELDS_BY_NAME = {field.field_name: field for _, field in _FIELD_SPECS}
 
 
-@dataclass
+def _job_score(job: BackfillJob) -> float:
+    """Queue score ordering jobs by priority, then creation time"""
+
+    return int(job.priority) * 1e10 + job.created_at.timestamp()
+
+
+def _serialize_job(job: BackfillJob) -> str:
+    """Serialize a pending job for the Redis queue"""
+
+    return json.dumps(
+        {
+            "job_id": job.job_id,
+            "innovation_id": job.innovation_id,
+            "innovation_title": job.innovation_title,
+            "innovation_description": job.innovation_description,
+            "missing_fields": [field.field_name for field in job.missing_fields],
+            "priority": int(job.priority),
+            "created_at": job.created_at.isoformat(),
+            "estimated_total_cost": job.estimated_total_cost,
+        }
+    )
+
+
+def _deserialize_job(data: str) -> BackfillJob:
+    """Rebuild a pending job claimed from the Redis queue"""
+
+    fields = json.loads(data)
+    return BackfillJob(
+        job_id=fields["job_id"],
+        innovation_id=fields["innovation_id"],
+        innovation_title=fields["innovation_title"],
+        innovation_description=fields["innovation_description"],
+        missing_fields=[
+            _MISSING_FIELDS_BY_NAME[name] for name in fields["missing_fields"]
+        ],
+        status=BackfillStatus.PENDING,
+        priority=BackfillPriority(fields["priority"]),
+        created_at=datetime.fromisoformat(fields["created_at"]),
+        results={},
+        estimated_total_cost=fields["estimated_total_cost"],
+    )
+
+
+def _load_openai_json(content: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Decode an OpenAI JSON-mode response, or None when it is empty"""
+
+    if not content or content.isspace():
+        return None
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        # json also accepts NaN/Infinity literals, which orjson rejects
+        return json.loads(content)
+
+
+@dataclass(frozen=True, slots=True)
 class BackfillResult:
     """Result of a backfill operation"""
 
@@ -92,7 +460,10 @@ class AIBackfillService:
     """AI-powered service for backfilling missing innovation properties"""
 
     def __init__(self):
-        self.openai_client = openai.AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # Pooled OpenAI client, opened by start() and closed by stop()
+        self._openai_http: Optional[httpx.AsyncClient] = None
+        self.openai_client: Optional[openai.AsyncOpenAI] = None
+        self._openai_warmup: Optional[asyncio.Task] = None
         self.perplexity_key = settings.PERPLEXITY_API_KEY
         self.serper_key = settings.SERPER_API_KEY
 
@@ -101,124 +472,167 @@ class AIBackfillService:
         self.current_daily_cost = 0.0
         self.last_cost_reset = datetime.now().date()
 
-        # Job queue
-        self.job_queue: List[BackfillJob] = []
+        # Serper lookups cancelled because Perplexity was already confident
+        self.serper_calls_saved = 0
+
+        # Job queue: Redis ZSET shared across processes, connected per event loop.
+        # Without Redis, an in-process heap of (priority, created_at, tiebreaker,
+        # job); cancelled entries drop out of the live id set and are skipped
+        # when they reach the top
+        self._redis: Optional[aioredis.Redis] = None
+        self._redis_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis_queue_depth = 0
+        self._heap: List[Tuple[int, datetime, int, BackfillJob]] = []
+        self._heap_job_ids: Set[str] = set()
+        self._counter = itertools.count()
+
+        # Jobs this process has taken off the queue, by status
+        self._status_counts: Counter = Counter()
+
+        # Per-upstream circuit breakers; Serper reports failures as empty results,
+        # which its null cache already short-circuits
+        self._perplexity_breaker = _CircuitBreaker("Perplexity")
+        self._openai_breaker = _CircuitBreaker("OpenAI")
+
+        # Caps concurrent field lookups across all jobs
+        self._field_sem = asyncio.Semaphore(settings.BACKFILL_FIELD_CONCURRENCY)
+
+        # Micro-batcher coalescing OpenAI parse requests, started lazily per event loop
+        self._parse_queue: Optional[asyncio.Queue] = None
+        self._parse_worker: Optional[asyncio.Task] = None
+        self._parse_batches: Set[asyncio.Task] = set()
+
+        # Long-lived upstream clients sharing one connection pool, opened by start()
+        self._connector: Optional[aiohttp.TCPConnector] = None
+        self._perplexity: Optional[PerplexityAfricanAIModule] = None
+        self._serper: Optional[SerperService] = None
+        self._clients_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def start(self):
+        """Open the shared connection pool, upstream clients and limiters for this event loop"""
+
+        loop = asyncio.get_running_loop()
+        if (
+            self._connector is not None
+            and not self._connector.closed
+            and self._clients_loop is loop
+        ):
+            return
 
-    async def analyze_missing_fields(
-        self, innovation: Dict[str, Any]
-    ) -> List[MissingField]:
-        """Analyze an innovation record to identify missing fields"""
+        self._clients_loop = loop
 
-        missing_fields = []
-
-        # Critical missing fields
-        if not innovation.get("fundings") or len(innovation.get("fundings", [])) == 0:
-            missing_fields.append(
-                MissingField(
-                    field_name="funding_amount",
-                    field_type="funding",
-                    priority=BackfillPriority.CRITICAL,
-                    search_strategy="perplexity",
-                    estimated_cost=0.10,
-                )
-            )
+        # Per-upstream request-rate limiters and concurrency caps, bound to this loop
+        self._perplexity_limiter = AsyncLimiter(settings.BACKFILL_PERPLEXITY_RPM, 60)
+        self._serper_limiter = AsyncLimiter(settings.BACKFILL_SERPER_RPM, 60)
+        self._openai_limiter = AsyncLimiter(settings.BACKFILL_OPENAI_RPM, 60)
+        self._perplexity_sem = asyncio.Semaphore(PERPLEXITY_MAX_CONCURRENCY)
+        self._serper_sem = asyncio.Semaphore(SERPER_MAX_CONCURRENCY)
+        self._openai_sem = asyncio.Semaphore(OPENAI_MAX_CONCURRENCY)
 
-        if not innovation.get("website_url"):
-            missing_fields.append(
-                MissingField(
-                    field_name="website_url",
-                    field_type="urls",
-                    priority=BackfillPriority.CRITICAL,
-                    search_strategy="serper",
-                    estimated_cost=0.05,
-                )
-            )
+        self._connector = aiohttp.TCPConnector(
+            limit=100, limit_per_host=64, keepalive_timeout=75
+        )
+        self._perplexity = await PerplexityAfricanAIModule(
+            self.perplexity_key, connector=self._connector
+        ).__aenter__()
+        self._serper = await SerperService(connector=self._connector).__aenter__()
+
+        self._openai_http = httpx.AsyncClient(
+            timeout=openai.DEFAULT_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=OPENAI_KEEPALIVE_SECONDS,
+            ),
+        )
+        # SDK retries off: _openai_chat owns the rate-limit backoff and the
+        # circuit breaker, so retries don't stack
+        self.openai_client = openai.AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=self._openai_http,
+            max_retries=0,
+        )
 
-        # High priority missing fields
-        if (
-            not innovation.get("organizations")
-            or len(innovation.get("organizations", [])) == 0
-        ):
-            missing_fields.append(
-                MissingField(
-                    field_name="founding_organization",
-                    field_type="contact",
-                    priority=BackfillPriority.HIGH,
-                    search_strategy="combined",
-                    estimated_cost=0.15,
-                )
-            )
+        # Open the OpenAI connection while the first Perplexity call is in flight,
+        # so the parse that follows it doesn't pay the TLS handshake
+        self._openai_warmup = loop.create_task(self._warm_openai_connection())
 
-        if (
-            not innovation.get("individuals")
-            or len(innovation.get("individuals", [])) == 0
-        ):
-            missing_fields.append(
-                MissingField(
-                    field_name="key_team_members",
-                    field_type="team",
-                    priority=BackfillPriority.HIGH,
-                    search_strategy="perplexity",
-                    estimated_cost=0.08,
-                )
-            )
+    async def _warm_openai_connection(self):
+        """Establish a pooled OpenAI connection with a token-free request"""
 
-        # Medium priority missing fields
-        if not innovation.get("github_url"):
-            missing_fields.append(
-                MissingField(
-                    field_name="github_url",
-                    field_type="urls",
-                    priority=BackfillPriority.MEDIUM,
-                    search_strategy="serper",
-                    estimated_cost=0.03,
-                )
-            )
+        try:
+            await self.openai_client.models.retrieve("gpt-4o-mini")
+        except Exception as e:
+            logger.debug(f"OpenAI connection warm-up failed: {e}")
 
-        if not innovation.get("impact_metrics") or not innovation.get(
-            "impact_metrics", {}
-        ).get("users_reached"):
-            missing_fields.append(
-                MissingField(
-                    field_name="user_metrics",
-                    field_type="metrics",
-                    priority=BackfillPriority.MEDIUM,
-                    search_strategy="perplexity",
-                    estimated_cost=0.07,
-                )
-            )
+    async def stop(self):
+        """Close upstream clients, the shared connection pool and the parse worker"""
 
-        # NEW: Market sizing data - High priority for comprehensive innovation profiles
-        if not innovation.get("market_sizing") or not innovation.get("market_sizing", {}):
-            missing_fields.append(
-                MissingField(
-                    field_name="market_sizing",
-                    field_type="market_data",
-                    priority=BackfillPriority.HIGH,
-                    search_strategy="perplexity",
-                    estimated_cost=0.12,
-                )
-            )
+        for task in (self._parse_worker, self._openai_warmup):
+            if task is not None:
+                task.cancel()
+        self._parse_worker = self._openai_warmup = None
 
-        # Low priority missing fields
-        if not innovation.get("demo_url"):
-            missing_fields.append(
-                MissingField(
-                    field_name="demo_url",
-                    field_type="urls",
-                    priority=BackfillPriority.LOW,
-                    search_strategy="serper",
-                    estimated_cost=0.02,
-                )
-            )
+        for client in (self._perplexity, self._serper):
+            if client is not None:
+                await client.__aexit__(None, None, None)
+        self._perplexity = self._serper = None
+
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+
+        if self._openai_http is not None:
+            await self._openai_http.aclose()
+        self._openai_http = self.openai_client = None
+
+        if self._redis is not None:
+            await self._redis.close()
+        self._redis = self._redis_loop = None
+
+    async def _connect_job_queue(self):
+        """Connect the Redis job queue for this event loop, or fall back to the heap"""
+
+        loop = asyncio.get_running_loop()
+        if self._redis_loop is loop:
+            return
+
+        self._redis_loop = loop
+        self._redis = None
+        redis = aioredis.from_url(
+            unified_cache.redis_url, decode_responses=True, socket_connect_timeout=2
+        )
+        try:
+            await redis.ping()
+        except Exception as e:
+            logger.warning(f"⚠️ Redis job queue unavailable, queueing in process: {e}")
+            await redis.close()
+            return
+
+        self._redis = redis
+
+    async def analyze_missing_fields(
+        self, innovation: Dict[str, Any]
+    ) -> List[MissingField]:
+        """Analyze an innovation record to identify missing fields"""
+
+        missing_fields = [
+            field for is_missing, field in _FIELD_SPECS if is_missing(innovation)
+        ]
 
         logger.info(
             f"Found {len(missing_fields)} missing fields for innovation {innovation.get('id')}"
         )
         return missing_fields
 
-    async def create_backfill_job(self, innovation: Dict[str, Any]) -> BackfillJob:
-        """Create a backfill job for an innovation"""
+    async def create_backfill_job(
+        self, innovation: Dict[str, Any], enqueue: bool = True
+    ) -> BackfillJob:
+        """Create a backfill job for an innovation
+
+        Pass `enqueue=False` when the caller processes the job itself, so a
+        scheduled run doesn't pick it up and pay for it a second time.
+        """
 
         missing_fields = await self.analyze_missing_fields(innovation)
 
@@ -228,11 +642,8 @@ class AIBackfillService:
             )
             return None
 
-        # Determine overall priority
-        priorities = [field.priority for field in missing_fields]
-        overall_priority = min(
-            priorities
-        )  # Highest priority (CRITICAL = lowest enum value)
+        # Determine overall priority (CRITICAL = lowest value)
+        overall_priority = min(field.priority for field in missing_fields)
 
         job = BackfillJob(
             job_id=f"backfill_{innovation.get('id')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -244,19 +655,144 @@ class AIBackfillService:
             priority=overall_priority,
             created_at=datetime.now(),
             results={},
+            estimated_total_cost=sum(field.estimated_cost for field in missing_fields),
         )
 
-        self.job_queue.append(job)
+        if enqueue and not await self._enqueue_job(job):
+            logger.info(
+                f"Backfill already queued for innovation {job.innovation_id}, skipping"
+            )
+            return None
         logger.info(
             f"Created backfill job {job.job_id} with {len(missing_fields)} tasks"
         )
         return job
 
+    async def _enqueue_job(self, job: BackfillJob) -> bool:
+        """Add a job to the Redis queue, or the in-process heap without Redis
+
+        Returns False when the innovation already has a queued or running job.
+        """
+
+        await self._connect_job_queue()
+        if self._redis is None:
+            heapq.heappush(
+                self._heap,
+                (int(job.priority), job.created_at, next(self._counter), job),
+            )
+            self._heap_job_ids.add(job.job_id)
+            return True
+
+        queued, self._redis_queue_depth = await self._redis.eval(
+            _ENQUEUE_JOB_SCRIPT,
+            4,
+            BACKFILL_QUEUE_KEY,
+            BACKFILL_IN_PROGRESS_KEY,
+            f"{BACKFILL_JOB_KEY_PREFIX}{job.job_id}",
+            f"{BACKFILL_INNOVATION_KEY_PREFIX}{job.innovation_id}",
+            job.job_id,
+            _job_score(job),
+            _serialize_job(job),
+            BACKFILL_JOB_TTL_SECONDS,
+        )
+        return bool(queued)
+
+    async def _claim_next_job(self) -> Optional[BackfillJob]:
+        """Pop the most urgent queued job, or None once the queue is empty"""
+
+        # Jobs queued in process while Redis was unavailable go first
+        while self._heap:
+            job = heapq.heappop(self._heap)[-1]
+            if job.job_id in self._heap_job_ids:
+                self._heap_job_ids.discard(job.job_id)
+                return job
+
+        while self._redis is not None:
+            # The claim script runs atomically, so each job goes to exactly one
+            # worker and stays tracked as in progress until it is finished
+            job_id, self._redis_queue_depth = await self._redis.eval(
+                _CLAIM_JOB_SCRIPT,
+                2,
+                BACKFILL_QUEUE_KEY,
+                BACKFILL_IN_PROGRESS_KEY,
+                time.time(),
+            )
+            if not job_id:
+                return None
+
+            data = await self._redis.get(f"{BACKFILL_JOB_KEY_PREFIX}{job_id}")
+            if data is not None:
+                return _deserialize_job(data)
+
+            # Cancelled after it was queued
+            await self._redis.zrem(BACKFILL_IN_PROGRESS_KEY, job_id)
+
+        return None
+
+    async def _finish_claimed_job(self, job: BackfillJob):
+        """Drop a processed job's in-progress entry and its queue document"""
+
+        if self._redis is None:
+            return
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.zrem(BACKFILL_IN_PROGRESS_KEY, job.job_id)
+            pipe.delete(f"{BACKFILL_JOB_KEY_PREFIX}{job.job_id}")
+            await pipe.execute()
+
+    async def _requeue_stale_claims(self):
+        """Return jobs claimed by workers that never finished them to the queue"""
+
+        if self._redis is None:
+            return
+
+        cutoff = time.time() - BACKFILL_CLAIM_TIMEOUT_SECONDS
+        stale_ids = await self._redis.zrangebyscore(
+            BACKFILL_IN_PROGRESS_KEY, "-inf", cutoff
+        )
+        for job_id in stale_ids:
+            data = await self._redis.get(f"{BACKFILL_JOB_KEY_PREFIX}{job_id}")
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.zrem(BACKFILL_IN_PROGRESS_KEY, job_id)
+                if data is not None:
+                    pipe.zadd(
+                        BACKFILL_QUEUE_KEY, {job_id: _job_score(_deserialize_job(data))}
+                    )
+                await pipe.execute()
+
+        if stale_ids:
+            logger.warning(f"Requeued {len(stale_ids)} stale backfill jobs")
+
+    async def cancel_backfill_job(self, job_id: str):
+        """Cancel a queued backfill job"""
+
+        await self._connect_job_queue()
+        if self._redis is not None:
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.zrem(BACKFILL_QUEUE_KEY, job_id)
+                pipe.zrem(BACKFILL_IN_PROGRESS_KEY, job_id)
+                pipe.delete(f"{BACKFILL_JOB_KEY_PREFIX}{job_id}")
+                pipe.zcard(BACKFILL_QUEUE_KEY)
+                removed, _, _, self._redis_queue_depth = await pipe.execute()
+            if removed:
+                return
+
+        # Heap entries are dropped when they reach the front
+        self._heap_job_ids.discard(job_id)
+
+    def _set_status(self, job: BackfillJob, status: BackfillStatus):
+        """Move a job to a new status, keeping the per-status counts current"""
+
+        if job.status != BackfillStatus.PENDING:
+            self._status_counts[job.status] -= 1
+        self._status_counts[status] += 1
+        job.status = status
+
     async def process_backfill_job(self, job: BackfillJob) -> BackfillJob:
         """Process a single backfill job using the double-hit approach"""
 
         logger.info(f"Starting backfill job {job.job_id}")
-        job.status = BackfillStatus.IN_PROGRESS
+        self._set_status(job, BackfillStatus.IN_PROGRESS)
         job.started_at = datetime.now()
 
         try:
@@ -264,59 +800,43 @@ class AIBackfillService:
             self._check_daily_cost_reset()
 
             # Check daily cost limit
-            estimated_total_cost = sum(
-                field.estimated_cost for field in job.missing_fields
-            )
-            if self.current_daily_cost + estimated_total_cost > self.daily_cost_limit:
+            if (
+                self.current_daily_cost + job.estimated_total_cost
+                > self.daily_cost_limit
+            ):
                 logger.warning(
                     f"Daily cost limit would be exceeded. Skipping job {job.job_id}"
                 )
-                job.status = BackfillStatus.SKIPPED
+                self._set_status(job, BackfillStatus.SKIPPED)
                 job.error_message = "Daily cost limit would be exceeded"
                 return job
 
-            # Process each missing field
+            # Process all missing fields concurrently
+            results = await asyncio.gather(
+                *(self._process_field(job, field) for field in job.missing_fields),
+                return_exceptions=True,
+            )
+
             job.results = {}
             total_cost = 0.0
 
-            for field in job.missing_fields:
-                try:
-                    logger.info(
-                        f"Processing field {field.field_name} using {field.search_strategy}"
-                    )
-
-                    if field.search_strategy == "perplexity":
-                        result = await self._backfill_with_perplexity(job, field)
-                    elif field.search_strategy == "serper":
-                        result = await self._backfill_with_serper(job, field)
-                    elif field.search_strategy == "combined":
-                        result = await self._backfill_with_combined_approach(job, field)
-                    else:
-                        logger.warning(
-                            f"Unknown search strategy: {field.search_strategy}"
-                        )
-                        continue
-
-                    if result:
-                        job.results[field.field_name] = result
-                        total_cost += result.cost
-                        logger.info(
-                            f"Successfully backfilled {field.field_name} with confidence {result.confidence_score:.2f}"
-                        )
-
-                    # Rate limiting between field processing
-                    await asyncio.sleep(2)
-
-                except Exception as e:
-                    logger.error(f"Error processing field {field.field_name}: {e}")
+            for field, result in zip(job.missing_fields, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error processing field {field.field_name}: {result}")
                     job.results[field.field_name] = {
-                        "error": str(e),
+                        "error": str(result),
                         "status": "failed",
                     }
+                elif result:
+                    job.results[field.field_name] = result
+                    total_cost += result.cost
+                    logger.info(
+                        f"Successfully backfilled {field.field_name} with confidence {result.confidence_score:.2f}"
+                    )
 
             job.total_cost = total_cost
             self.current_daily_cost += total_cost
-            job.status = BackfillStatus.COMPLETED
+            self._set_status(job, BackfillStatus.COMPLETED)
             job.completed_at = datetime.now()
 
             logger.info(
@@ -325,12 +845,32 @@ class AIBackfillService:
 
         except Exception as e:
             logger.error(f"Error processing backfill job {job.job_id}: {e}")
-            job.status = BackfillStatus.FAILED
+            self._set_status(job, BackfillStatus.FAILED)
             job.error_message = str(e)
             job.completed_at = datetime.now()
 
         return job
 
+    async def _process_field(
+        self, job: BackfillJob, field: MissingField
+    ) -> Optional[BackfillResult]:
+        """Backfill a single missing field with its search strategy"""
+
+        async with self._field_sem:
+            logger.info(
+                f"Processing field {field.field_name} using {field.search_strategy}"
+            )
+
+            if field.search_strategy == "perplexity":
+                return await self._backfill_with_perplexity(job, field)
+            elif field.search_strategy == "serper":
+                return await self._backfill_with_serper(job, field)
+            elif field.search_strategy == "combined":
+                return await self._backfill_with_combined_approach(job, field)
+
+            logger.warning(f"Unknown search strategy: {field.search_strategy}")
+            return None
+
     async def _backfill_with_perplexity(
         self, job: BackfillJob, field: MissingField
     ) -> Optional[BackfillResult]:
@@ -340,35 +880,44 @@ class AIBackfillService:
         prompt = self._create_perplexity_prompt(job, field)
 
         try:
-            async with PerplexityAfricanAIModule(self.perplexity_key) as perplexity:
-                # Call Perplexity API
-                response = await perplexity._call_perplexity_api(prompt)
-                raw_content = (
-                    response.get("choices", [{}])[0]
-                    .get("message", {})
-                    .get("content", "")
-                )
+            await self.start()
 
-                if not raw_content:
-                    return None
-
-                # Second hit: Use OpenAI to parse and structure the response
-                structured_data = await self._parse_with_openai(raw_content, field)
-
-                if structured_data:
-                    return BackfillResult(
-                        innovation_id=job.innovation_id,
-                        field_name=field.field_name,
-                        old_value=None,
-                        new_value=structured_data.get("value"),
-                        confidence_score=structured_data.get("confidence", 0.5),
-                        data_source="perplexity_openai",
-                        validation_status=self._determine_validation_status(
-                            structured_data.get("confidence", 0.5)
-                        ),
-                        cost=field.estimated_cost,
-                    )
+            # Call Perplexity API
+            self._perplexity_breaker.check()
+            async with self._perplexity_sem, self._perplexity_limiter:
+                try:
+                    response = await self._perplexity._call_perplexity_api(prompt)
+                except Exception:
+                    self._perplexity_breaker.record_failure()
+                    raise
+            self._perplexity_breaker.record_success()
+            raw_content = (
+                response.get("choices", [{}])[0].get("message", {}).get("content", "")
+            )
 
+            if not raw_content:
+                return None
+
+            # Second hit: Use OpenAI to parse and structure the response
+            structured_data = await self._parse_with_openai(raw_content, field)
+
+            if structured_data:
+                return BackfillResult(
+                    innovation_id=job.innovation_id,
+                    field_name=field.field_name,
+                    old_value=None,
+                    new_value=structured_data.get("value"),
+                    confidence_score=structured_data.get("confidence", 0.5),
+                    data_source="perplexity_openai",
+                    validation_status=self._determine_validation_status(
+                        structured_data.get("confidence", 0.5)
+                    ),
+                    cost=field.estimated_cost,
+                )
+
+        except CircuitOpenError:
+            logger.debug(f"Skipping Perplexity backfill for {field.field_name}")
+            return None
         except Exception as e:
             logger.error(f"Error in Perplexity backfill for {field.field_name}: {e}")
             return None
@@ -382,31 +931,35 @@ class AIBackfillService:
         search_query = self._create_serper_query(job, field)
 
         try:
-            async with SerperService() as serper:
-                # Perform targeted search
-                search_results = await serper.search_web(search_query, num_results=10)
+            await self.start()
 
-                if not search_results.results:
-                    return None
-
-                # Extract value from search results using pattern matching
-                extracted_value = await self._extract_value_from_search_results(
-                    search_results.results, field
+            # Perform targeted search
+            async with self._serper_sem, self._serper_limiter:
+                search_results = await self._serper.search_web(
+                    search_query, num_results=10
                 )
 
-                if extracted_value:
-                    return BackfillResult(
-                        innovation_id=job.innovation_id,
-                        field_name=field.field_name,
-                        old_value=None,
-                        new_value=extracted_value.get("value"),
-                        confidence_score=extracted_value.get("confidence", 0.6),
-                        data_source="serper",
-                        validation_status=self._determine_validation_status(
-                            extracted_value.get("confidence", 0.6)
-                        ),
-                        cost=field.estimated_cost,
-                    )
+            if not search_results.results:
+                return None
+
+            # Extract value from search results using pattern matching
+            extracted_value = await self._extract_value_from_search_results(
+                search_results.results, field
+            )
+
+            if extracted_value:
+                return BackfillResult(
+                    innovation_id=job.innovation_id,
+                    field_name=field.field_name,
+                    old_value=None,
+                    new_value=extracted_value.get("value"),
+                    confidence_score=extracted_value.get("confidence", 0.6),
+                    data_source="serper",
+                    validation_status=self._determine_validation_status(
+                        extracted_value.get("confidence", 0.6)
+                    ),
+                    cost=field.estimated_cost,
+                )
 
         except Exception as e:
             logger.error(f"Error in Serper backfill for {field.field_name}: {e}")
@@ -417,11 +970,39 @@ class AIBackfillService:
     ) -> Optional[BackfillResult]:
         """Use both Perplexity and Serper for comprehensive backfilling"""
 
-        # Try Perplexity first
-        perplexity_result = await self._backfill_with_perplexity(job, field)
+        # Query Perplexity and Serper concurrently
+        perplexity_task = asyncio.create_task(
+            self._backfill_with_perplexity(job, field)
+        )
+        serper_task = asyncio.create_task(self._backfill_with_serper(job, field))
 
-        # Try Serper as well
-        serper_result = await self._backfill_with_serper(job, field)
+        try:
+            done, _ = await asyncio.wait(
+                {perplexity_task, serper_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            # A confident Perplexity answer makes the Serper lookup unnecessary
+            if perplexity_task in done and not serper_task.done():
+                perplexity_result = self._task_result(
+                    perplexity_task, "Perplexity", field
+                )
+                if (
+                    perplexity_result
+                    and perplexity_result.confidence_score
+                    >= SPECULATIVE_CONFIDENCE_THRESHOLD
+                ):
+                    serper_task.cancel()
+                    self.serper_calls_saved += 1
+                    return perplexity_result
+
+            await asyncio.wait({perplexity_task, serper_task})
+        finally:
+            for task in (perplexity_task, serper_task):
+                if not task.done():
+                    task.cancel()
+
+        perplexity_result = self._task_result(perplexity_task, "Perplexity", field)
+        serper_result = self._task_result(serper_task, "Serper", field)
 
         # Combine and validate results
         if perplexity_result and serper_result:
@@ -455,162 +1036,183 @@ class AIBackfillService:
 
         return None
 
-    def _create_perplexity_prompt(self, job: BackfillJob, field: MissingField) -> str:
-        """Create targeted Perplexity prompt based on field type"""
-
-        base_context = f"""
-        Please share data publicly available on the AI innovation "{job.innovation_title}".
-        
-        Innovation Description: {job.innovation_description}
-        
-        I specifically need information about: {field.field_name}
-        """
+    def _task_result(
+        self, task: asyncio.Task, source: str, field: MissingField
+    ) -> Optional[BackfillResult]:
+        """Return a finished backfill task's result, logging and dropping errors"""
 
-        if field.field_type == "funding":
-            return (
-                base_context
-                + """
-            
-            Please focus on:
-            - Funding amounts raised (with currency)
-            - Investment rounds (seed, Series A, B, etc.)
-            - Investor names and organizations
-            - Funding dates and announcements
-            - Valuation information if available
-            
-            Provide specific, verifiable details with sources when possible.
-            """
+        if task.cancelled():
+            return None
+        if task.exception() is not None:
+            logger.error(
+                f"Error in {source} backfill for {field.field_name}: {task.exception()}"
             )
+            return None
+        return task.result()
 
-        elif field.field_type == "contact":
-            return (
-                base_context
-                + """
-            
-            Please focus on:
-            - Company/organization name and official details
-            - Founding team and key personnel
-            - Official contact information
-            - Company registration details
-            - Location and headquarters information
-            
-            Provide verified, publicly available information only.
-            """
-            )
+    def _create_perplexity_prompt(self, job: BackfillJob, field: MissingField) -> str:
+        """Create targeted Perplexity prompt based on field type"""
 
-        elif field.field_type == "team":
-            return (
-                base_context
-                + """
-            
-            Please focus on:
-            - Founders and co-founders
-            - Key team members and their roles
-            - Leadership team information
-            - Technical team leads
-            - Advisory board members
-            
-            Include names, titles, and background information when available.
-            """
-            )
+        return _PERPLEXITY_PROMPTS.get(
+            field.field_type, _PERPLEXITY_DEFAULT_PROMPT
+        ).format(
+            title=job.innovation_title,
+            description=job.innovation_description,
+            field_name=field.field_name,
+        )
 
-        elif field.field_type == "urls":
-            return (
-                base_context
-                + """
-            
-            Please focus on finding:
-            - Official website URL
-            - GitHub repository links
-            - Demo or product URLs
-            - Social media profiles
-            - App store links
-            
-            Verify that URLs are current and accessible.
-            """
-            )
+    def _create_serper_query(self, job: BackfillJob, field: MissingField) -> str:
+        """Create targeted Serper search query"""
 
-        elif field.field_type == "metrics":
-            return (
-                base_context
-                + """
-            
-            Please focus on:
-            - User metrics (active users, downloads, etc.)
-            - Revenue information if publicly disclosed
-            - Growth metrics and milestones
-            - Market traction indicators
-            - Impact metrics and social outcomes
-            
-            Provide quantifiable data with sources when possible.
-            """
-            )
+        if field.field_type == "urls":
+            template = _SERPER_URL_QUERIES.get(field.field_name)
+        else:
+            template = _SERPER_QUERIES.get(field.field_type)
 
-        elif field.field_type == "market_data":
-            return (
-                base_context
-                + """
-            
-            Please focus on:
-            - Total Addressable Market (TAM) size and projections
-            - Serviceable Addressable Market (SAM) estimates  
-            - Serviceable Obtainable Market (SOM) potential
-            - Market growth rates and trends
-            - Competitive landscape and market position
-            - Revenue models and monetization strategies
-            - Customer segments and market penetration
-            - Industry analysis and sector-specific data
-            
-            Provide specific market size figures in billions/millions with currency.
-            Include growth percentages and market projections when available.
-            """
-            )
+        if template is None:
+            return f'"{job.innovation_title}" {field.field_name}'
+        return template.format(name=job.innovation_title)
 
-        return (
-            base_context
-            + f"\nPlease provide detailed, factual information about {field.field_name}."
-        )
+    async def _parse_with_openai(
+        self, raw_content: str, field: MissingField
+    ) -> Optional[Dict[str, Any]]:
+        """Second hit: Use OpenAI to parse Perplexity output into structured JSON"""
 
-    def _create_serper_query(self, job: BackfillJob, field: MissingField) -> str:
-        """Create targeted Serper search query"""
+        # Identical content parsed for the same field reuses the earlier result
+        cache_params = {
+            "backfill_parse": hashlib.blake2b(
+                f"{field.field_name}\0{field.field_type}\0{raw_content}".encode(),
+                digest_size=16,
+            ).hexdigest()
+        }
 
-        innovation_name = job.innovation_title
+        try:
+            cached_response = await get_cached_response(DataSource.OPENAI, cache_params)
+            if cached_response:
+                return cached_response
+            if await is_null_cached(DataSource.OPENAI, cache_params):
+                return None
+        except Exception as e:
+            logger.warning(f"Error checking OpenAI parse cache: {e}")
 
-        if field.field_type == "funding":
-            return f'"{innovation_name}" AND (funding OR investment OR "raised" OR "million" OR "series")'
+        try:
+            structured_data = await self._enqueue_parse(raw_content, field)
+        except Exception as e:
+            logger.error(f"Error parsing with OpenAI: {e}")
+            return None
 
-        elif field.field_type == "urls":
-            if field.field_name == "website_url":
-                return f'"{innovation_name}" AND (website OR "official site" OR domain)'
-            elif field.field_name == "github_url":
-                return (
-                    f'"{innovation_name}" AND (github OR repository OR "open source")'
+        try:
+            if structured_data:
+                await cache_api_response(
+                    DataSource.OPENAI, cache_params, structured_data, 24.0
                 )
-            elif field.field_name == "demo_url":
-                return f'"{innovation_name}" AND (demo OR "try it" OR "live app")'
+            else:
+                await cache_null_response(DataSource.OPENAI, cache_params, "no_data")
+        except Exception as e:
+            logger.warning(f"Error caching OpenAI parse result: {e}")
 
-        elif field.field_type == "contact":
-            return f'"{innovation_name}" AND (company OR organization OR founded OR headquarters)'
+        return structured_data
 
-        elif field.field_type == "team":
-            return f'"{innovation_name}" AND (founder OR "founded by" OR team OR CEO)'
+    def _enqueue_parse(self, raw_content: str, field: MissingField) -> asyncio.Future:
+        """Queue a parse request for the batch worker and return its future"""
 
-        elif field.field_type == "metrics":
-            return (
-                f'"{innovation_name}" AND (users OR customers OR downloads OR revenue)'
+        loop = asyncio.get_running_loop()
+        if (
+            self._parse_worker is None
+            or self._parse_worker.done()
+            or self._parse_worker.get_loop() is not loop
+        ):
+            self._parse_queue = asyncio.Queue()
+            self._parse_worker = loop.create_task(
+                self._openai_batch_worker(self._parse_queue)
             )
 
-        elif field.field_type == "market_data":
-            return (
-                f'"{innovation_name}" AND (market size OR TAM OR SAM OR "billion market" OR "market opportunity")'
-            )
+        future = loop.create_future()
+        self._parse_queue.put_nowait((raw_content, field, future))
+        return future
 
-        return f'"{innovation_name}" {field.field_name}'
+    async def _openai_batch_worker(self, queue: asyncio.Queue):
+        """Drain parse requests into batches and dispatch each batch concurrently"""
 
-    async def _parse_with_openai(
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + OPENAI_PARSE_BATCH_WINDOW_SECONDS
+
+            while len(batch) < OPENAI_PARSE_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            task = asyncio.create_task(self._run_parse_batch(batch))
+            self._parse_batches.add(task)
+            task.add_done_callback(self._parse_batches.discard)
+
+    async def _run_parse_batch(
+        self, batch: List[Tuple[str, MissingField, asyncio.Future]]
+    ):
+        """Parse a batch of requests and resolve their futures"""
+
+        items = [(raw_content, field) for raw_content, field, _ in batch]
+        results: List[Any] = [None] * len(items)
+        if len(items) > 1:
+            try:
+                results = await self._parse_batch_with_openai(items)
+            except Exception as e:
+                logger.warning(f"Batched OpenAI parse failed, parsing singly: {e}")
+
+        # Items the batch reply didn't cover are parsed on their own, so one bad
+        # reply doesn't cost every field in the batch its parse
+        missing = [idx for idx, result in enumerate(results) if result is None]
+        retried = await asyncio.gather(
+            *(self._parse_single_with_openai(*items[idx]) for idx in missing),
+            return_exceptions=True,
+        )
+        for idx, result in zip(missing, retried):
+            results[idx] = result
+
+        for (_, _, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    async def _openai_chat(self, **kwargs):
+        """Call the chat completions API under the OpenAI limiter, backing off on rate limits"""
+
+        await self.start()
+        self._openai_breaker.check()
+
+        for attempt in range(OPENAI_MAX_ATTEMPTS):
+            try:
+                async with self._openai_sem, self._openai_limiter:
+                    response = await self.openai_client.chat.completions.create(
+                        **kwargs
+                    )
+                self._openai_breaker.record_success()
+                return response
+            except openai.RateLimitError:
+                if attempt == OPENAI_MAX_ATTEMPTS - 1:
+                    self._openai_breaker.record_failure()
+                    raise
+                # Exponential backoff with full jitter so retries don't stampede
+                await asyncio.sleep(
+                    random.uniform(0, min(OPENAI_MAX_BACKOFF_SECONDS, 2**attempt))
+                )
+            except (openai.APIConnectionError, openai.InternalServerError):
+                self._openai_breaker.record_failure()
+                raise
+
+    async def _parse_single_with_openai(
         self, raw_content: str, field: MissingField
     ) -> Optional[Dict[str, Any]]:
-        """Second hit: Use OpenAI to parse Perplexity output into structured JSON"""
+        """Parse one Perplexity response into structured JSON"""
 
         parsing_prompt = f"""
         Parse the following content and extract structured information for the field "{field.field_name}" of type "{field.field_type}".
@@ -630,79 +1232,132 @@ class AIBackfillService:
         Focus on accuracy and provide confidence scores based on the quality of evidence found.
         """
 
-        try:
-            response = await self.openai_client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a data extraction expert. Extract structured information accurately and provide confidence scores.",
-                    },
-                    {"role": "user", "content": parsing_prompt},
-                ],
-                temperature=0.1,
-                max_tokens=500,
-                response_format={"type": "json_object"},
-            )
+        response = await self._openai_chat(
+            model="gpt-4o-mini",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are a data extraction expert. Extract structured information accurately and provide confidence scores.",
+                },
+                {"role": "user", "content": parsing_prompt},
+            ],
+            temperature=0.1,
+            max_tokens=500,
+            response_format={"type": "json_object"},
+        )
 
-            content = response.choices[0].message.content.strip()
-            if content:
-                return json.loads(content)
+        return _load_openai_json(response.choices[0].message.content)
 
-        except Exception as e:
-            logger.error(f"Error parsing with OpenAI: {e}")
-            return None
+    async def _parse_batch_with_openai(
+        self, items: List[Tuple[str, MissingField]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Parse several Perplexity responses into structured JSON with one call"""
+
+        sections = "\n".join(f"""
+        Item {idx}: field "{field.field_name}" of type "{field.field_type}"
+        Content to parse:
+        {raw_content}
+""" for idx, (raw_content, field) in enumerate(items))
+
+        parsing_prompt = f"""
+        Parse each of the following items and extract structured information for the field named in the item.
+        {sections}
+        Please extract and structure the information into JSON format with one result per item:
+        {{
+            "results": [
+                {{
+                    "item": 0,
+                    "value": "extracted value or structured data",
+                    "confidence": 0.0-1.0,
+                    "supporting_evidence": ["evidence1", "evidence2"],
+                    "source_reliability": "high|medium|low",
+                    "verification_notes": "any notes about verification"
+                }}
+            ]
+        }}
+        
+        Focus on accuracy and provide confidence scores based on the quality of evidence found.
+        """
+
+        response = await self._openai_chat(
+            model="gpt-4o-mini",
+            messages=[
+                {
+                    "role": "system",
+                    "content": "You are a data extraction expert. Extract structured information accurately and provide confidence scores.",
+                },
+                {"role": "user", "content": parsing_prompt},
+            ],
+            temperature=0.1,
+            max_tokens=500 * len(items),
+            response_format={"type": "json_object"},
+        )
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        parsed = _load_openai_json(response.choices[0].message.content)
+        if not parsed:
+            return results
+
+        for result in parsed.get("results", []):
+            if not isinstance(result, dict):
+                continue
+            idx = result.pop("item", None)
+            if isinstance(idx, int) and 0 <= idx < len(items):
+                results[idx] = result
+
+        return results
 
     async def _extract_value_from_search_results(
         self, search_results: List, field: MissingField
     ) -> Optional[Dict[str, Any]]:
         """Extract specific values from Serper search results using pattern matching"""
 
-        combined_text = " ".join(
-            [f"{result.title} {result.snippet}" for result in search_results[:5]]
-        )
-
         if field.field_type == "funding":
-            return self._extract_funding_patterns(combined_text)
+            extract = self._extract_funding_patterns
         elif field.field_type == "urls":
-            return self._extract_url_patterns(combined_text, field.field_name)
+            extract = functools.partial(
+                self._extract_url_patterns, field_name=field.field_name
+            )
         elif field.field_type == "contact":
-            return self._extract_contact_patterns(combined_text)
+            extract = self._extract_contact_patterns
+        else:
+            return None
+
+        # Each extractor has a fixed confidence, so the best-ranked result that
+        # matches is also the highest-confidence match
+        for result in search_results[:10]:
+            extracted = extract(f"{result.title} {result.snippet}")
+            if extracted:
+                return extracted
 
         return None
 
     def _extract_funding_patterns(self, text: str) -> Optional[Dict[str, Any]]:
         """Extract funding information using regex patterns"""
 
-        funding_patterns = [
-            r"raised\s+\$?(\d+(?:\.\d+)?)\s*(million|billion|M|B)",
-            r"funding\s+of\s+\$?(\d+(?:\.\d+)?)\s*(million|billion|M|B)",
-            r"\$(\d+(?:\.\d+)?)\s*(million|billion|M|B)\s+in\s+funding",
-            r"series\s+[A-Z]\s+of\s+\$?(\d+(?:\.\d+)?)\s*(million|billion|M|B)",
-        ]
+        match = _FUNDING_RE.search(text)
+        if not match:
+            return None
 
-        for pattern in funding_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                amount = float(match.group(1))
-                unit = match.group(2).lower()
+        # Only the matching alternative's (amount, unit) groups are set
+        amount_text, unit = [group for group in match.groups() if group is not None]
+        amount = float(amount_text)
+        unit = unit.lower()
 
-                # Convert to USD
-                if unit in ["billion", "b"]:
-                    amount *= 1000000000
-                elif unit in ["million", "m"]:
-                    amount *= 1000000
+        # Convert to USD
+        if unit in ["billion", "b"]:
+            amount *= 1000000000
+        elif unit in ["million", "m"]:
+            amount *= 1000000
 
-                return {
-                    "value": {
-                        "amount": amount,
-                        "currency": "USD",
-                        "raw_text": match.group(),
-                    },
-                    "confidence": 0.8,
-                }
-
-        return None
+        return {
+            "value": {
+                "amount": amount,
+                "currency": "USD",
+                "raw_text": match.group(),
+            },
+            "confidence": 0.8,
+        }
 
     def _extract_url_patterns(
         self, text: str, field_name: str
@@ -711,8 +1366,7 @@ class AIBackfillService:
 
         if field_name == "website_url":
             # Look for website URLs
-            url_pattern = r"https?://(?:www\.)?([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})"
-            matches = re.findall(url_pattern, text)
+            matches = _WEBSITE_RE.findall(text)
 
             if matches:
                 # Return the most likely website (shortest domain name)
@@ -721,8 +1375,7 @@ class AIBackfillService:
 
         elif field_name == "github_url":
             # Look for GitHub URLs
-            github_pattern = r"github\.com/([a-zA-Z0-9.-]+/[a-zA-Z0-9.-]+)"
-            match = re.search(github_pattern, text)
+            match = _GITHUB_RE.search(text)
 
             if match:
                 return {
@@ -736,16 +1389,9 @@ class AIBackfillService:
         """Extract contact/organization patterns"""
 
         # Look for company name patterns
-        company_patterns = [
-            r"company\s+([A-Z][a-zA-Z\s]+)",
-            r"startup\s+([A-Z][a-zA-Z\s]+)",
-            r"founded\s+([A-Z][a-zA-Z\s]+)",
-        ]
-
-        for pattern in company_patterns:
-            match = re.search(pattern, text)
-            if match:
-                return {"value": match.group(1).strip(), "confidence": 0.6}
+        match = _COMPANY_RE.search(text)
+        if match:
+            return {"value": match.group(1).strip(), "confidence": 0.6}
 
         return None
 
@@ -769,35 +1415,39 @@ class AIBackfillService:
             logger.info(f"Reset daily cost tracking for {today}")
 
     async def run_scheduled_backfill(self, max_jobs: int = 10) -> List[BackfillJob]:
-        """Run scheduled backfill jobs"""
+        """Run scheduled backfill jobs with a pool of queue workers"""
 
         logger.info(f"Starting scheduled backfill run (max {max_jobs} jobs)")
+        await self._connect_job_queue()
+        await self._requeue_stale_claims()
 
-        # Sort jobs by priority
-        self.job_queue.sort(key=lambda job: (job.priority.value, job.created_at))
-
-        # Process jobs
+        # Workers claim jobs in priority order until max_jobs are taken
         completed_jobs = []
-        jobs_to_process = self.job_queue[:max_jobs]
-
-        for job in jobs_to_process:
-            if job.status == BackfillStatus.PENDING:
-                try:
-                    completed_job = await self.process_backfill_job(job)
-                    completed_jobs.append(completed_job)
-
-                    # Remove from queue if completed or failed
-                    if completed_job.status in [
-                        BackfillStatus.COMPLETED,
-                        BackfillStatus.FAILED,
-                        BackfillStatus.SKIPPED,
-                    ]:
-                        self.job_queue.remove(job)
-
-                except Exception as e:
-                    logger.error(f"Error processing job {job.job_id}: {e}")
-                    job.status = BackfillStatus.FAILED
-                    job.error_message = str(e)
+        jobs_left = max_jobs
+
+        async def worker():
+            nonlocal jobs_left
+            while jobs_left > 0:
+                jobs_left -= 1
+                job = await self._claim_next_job()
+                if job is None:
+                    return
+
+                if job.status == BackfillStatus.PENDING:
+                    try:
+                        completed_job = await self.process_backfill_job(job)
+                        completed_jobs.append(completed_job)
+
+                    except Exception as e:
+                        logger.error(f"Error processing job {job.job_id}: {e}")
+                        self._set_status(job, BackfillStatus.FAILED)
+                        job.error_message = str(e)
+
+                await self._finish_claimed_job(job)
+
+        await asyncio.gather(
+            *(worker() for _ in range(min(max_jobs, settings.BACKFILL_WORKERS)))
+        )
 
         logger.info(f"Completed {len(completed_jobs)} backfill jobs")
         return completed_jobs
@@ -805,21 +1455,24 @@ class AIBackfillService:
     def get_backfill_stats(self) -> Dict[str, Any]:
         """Get backfill service statistics"""
 
-        total_jobs = len(self.job_queue)
-        pending_jobs = len(
-            [job for job in self.job_queue if job.status == BackfillStatus.PENDING]
-        )
-        completed_jobs = len(
-            [job for job in self.job_queue if job.status == BackfillStatus.COMPLETED]
-        )
+        # Redis depth as of the last enqueue or claim, to keep stats synchronous
+        pending_jobs = len(self._heap_job_ids) + self._redis_queue_depth
 
         return {
-            "total_jobs": total_jobs,
+            "total_jobs": pending_jobs + sum(self._status_counts.values()),
             "pending_jobs": pending_jobs,
-            "completed_jobs": completed_jobs,
+            "in_progress_jobs": self._status_counts[BackfillStatus.IN_PROGRESS],
+            "completed_jobs": self._status_counts[BackfillStatus.COMPLETED],
+            "failed_jobs": self._status_counts[BackfillStatus.FAILED],
+            "skipped_jobs": self._status_counts[BackfillStatus.SKIPPED],
             "current_daily_cost": self.current_daily_cost,
             "daily_cost_limit": self.daily_cost_limit,
             "cost_utilization": (self.current_daily_cost / self.daily_cost_limit) * 100,
+            "serper_calls_saved": self.serper_calls_saved,
+            "circuit_breakers": {
+                "perplexity": self._perplexity_breaker.current_state,
+                "openai": self._openai_breaker.current_state,
+            },
             "last_cost_reset": self.last_cost_reset.isoformat(),
         }
 
@@ -834,13 +1487,13 @@ async def create_backfill_jobs_for_innovations(
 ) -> List[BackfillJob]:
     """Create backfill jobs for a list of innovations"""
 
-    jobs = []
-    for innovation in innovations:
-        job = await ai_backfill_service.create_backfill_job(innovation)
-        if job:
-            jobs.append(job)
-
-    return jobs
+    jobs = await asyncio.gather(
+        *(
+            ai_backfill_service.create_backfill_job(innovation)
+            for innovation in innovations
+        )
+    )
+    return [job for job in jobs if job]
 
 
 async def run_backfill_batch(max_jobs: int = 10) -> List[BackfillJob]:
@@ -874,7 +1527,7 @@ if __name__ == "__main__":
 
             # Process the job (this would use real APIs in production)
             # processed_job = await ai_backfill_service.process_backfill_job(job)
-            print(f"Job priority: {job.priority.value}")
+            print(f"Job priority: {job.priority.name.lower()}")
 
         # Show stats
         stats = ai_backfill_service.get_backfill_stats()
@@ -7,12 +7,16 @@ snowball sampling for discovering new research papers and innovations.
 """
 
 import asyncio
+import functools
+import os
 import re
+import time
 import uuid
-from dataclasses import asdict, dataclass
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 from config.database import get_supabase
 from loguru import logger
@@ -24,6 +28,198 @@ from services.null_result_cache import (
     check_citation_cache,
 )
 
+# Quoted-title patterns tried in order on the context around a URL
+_QUOTE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'"([^"]+)"',
+        r"'([^']+)'",
+        r'titled\s+"([^"]+)"',
+        r'called\s+"([^"]+)"',
+    )
+]
+
+# Narrative references without a URL, e.g. "According to a study by..."
+# Possessive quantifiers (Python 3.11+) keep these linear on long unpunctuated text
+_REFERENCE_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"according to a (?:study|report|paper|research)(?:\s+by\s+([^,\.]++))?[^\.]*+\.([^\.]*+)",
+        r"research from ([^,\.]++)[^\.]*+\.([^\.]*+)",
+        r"a (?:study|report|paper) by ([^,\.]++)[^\.]*+\.([^\.]*+)",
+        r'(?:paper|study) titled "([^"]++)"[^\.]*+\.([^\.]*+)',
+    )
+]
+
+# Columns the snowball discovery queue reads from enrichment_citations
+_DISCOVERY_COLUMNS = (
+    "id, title, url, confidence_score, citation_type, "
+    "african_relevance_indicators, ai_relevance_indicators"
+)
+
+# Candidates fetched per discovery queue slot, ordered by confidence, leaving
+# room for the academic and African AI boosts to reorder them
+DISCOVERY_CANDIDATE_FACTOR = 3
+
+# Literal phrases at least one of which every _REFERENCE_PATTERNS match contains
+_REFERENCE_TRIGGERS = (
+    "according to a ",
+    "research from ",
+    "study by ",
+    "report by ",
+    "paper by ",
+    'paper titled "',
+    'study titled "',
+)
+
+# Citation metadata patterns, compiled once at import and shared by all extractors
+_URL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'https?://[^\s<>"{}|\\^`\[\]]+',
+        r'www\.[^\s<>"{}|\\^`\[\]]+',
+    )
+]
+_DOI_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"doi:?\s*10\.\d+/[^\s]+",
+        r"https?://doi\.org/10\.\d+/[^\s]+",
+        r"https?://dx\.doi\.org/10\.\d+/[^\s]+",
+    )
+]
+_ARXIV_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"arxiv:?\s*\d{4}\.\d{4,5}",
+        r"https?://arxiv\.org/abs/\d{4}\.\d{4,5}",
+    )
+]
+_JOURNAL_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"published in ([^.]+)",
+        r"appeared in ([^.]+)",
+        r"(\w+ Journal of \w+)",
+        r"(Nature|Science|Cell|PNAS)\s+(?:journal)?",
+    )
+]
+_AUTHOR_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"by ([A-Z][a-z]+ [A-Z][a-z]+(?:,?\s+(?:and\s+)?[A-Z][a-z]+ [A-Z][a-z]+)*)",
+        r"authored by ([^.]+)",
+        r"researchers? ([^.]+)",
+    )
+]
+
+# Lowercase substrings checked against URLs and context, one alternation per list
+_SKIP_DOMAINS = (
+    "twitter.com",
+    "facebook.com",
+    "instagram.com",
+    "youtube.com",
+    "tiktok.com",
+    "linkedin.com",
+)
+_ACADEMIC_DOMAINS = (
+    "arxiv.org",
+    "doi.org",
+    "pubmed",
+    "scholar.google",
+    "researchgate",
+    "acm.org",
+    "ieee.org",
+    "springer",
+    "nature.com",
+    "science.org",
+    "cell.com",
+)
+_ACADEMIC_URL_TERMS = (
+    "arxiv",
+    "doi.org",
+    "pubmed",
+    "acm.org",
+    "ieee.org",
+    "springer",
+    "nature.com",
+    "science.org",
+)
+_COMPANY_CONTEXT_TERMS = ("company", "startup", "founded", "ceo", "headquarters")
+_NEWS_URL_TERMS = (
+    "techcrunch",
+    "reuters",
+    "bloomberg",
+    "cnn",
+    "bbc",
+    "news",
+    "blog",
+    "medium.com",
+)
+_REPORT_CONTEXT_TERMS = ("report", "survey", "analysis", "study", "whitepaper")
+
+
+def _compile_terms(terms: Tuple[str, ...]) -> re.Pattern:
+    """Compile literal terms into one alternation regex"""
+    return re.compile("|".join(map(re.escape, terms)))
+
+
+_SKIP_RE = _compile_terms(_SKIP_DOMAINS)
+_ACADEMIC_RE = _compile_terms(_ACADEMIC_DOMAINS)
+_ACADEMIC_URL_RE = _compile_terms(_ACADEMIC_URL_TERMS)
+_COMPANY_CONTEXT_RE = _compile_terms(_COMPANY_CONTEXT_TERMS)
+_NEWS_URL_RE = _compile_terms(_NEWS_URL_TERMS)
+_REPORT_CONTEXT_RE = _compile_terms(_REPORT_CONTEXT_TERMS)
+
+# Relevance vocabularies, reported in this order. The confidence boosts use the
+# subsets below, so they reuse the terms already extracted for a citation.
+_AFRICAN_TERMS = (
+    "africa",
+    "african",
+    "nigeria",
+    "kenya",
+    "ghana",
+    "south africa",
+    "rwanda",
+    "uganda",
+    "tanzania",
+    "egypt",
+    "morocco",
+    "tunisia",
+    "lagos",
+    "nairobi",
+    "cape town",
+    "cairo",
+    "accra",
+    "kigali",
+)
+_AI_TERMS = (
+    "artificial intelligence",
+    "machine learning",
+    "deep learning",
+    "neural network",
+    "ai",
+    "ml",
+    "nlp",
+    "computer vision",
+    "data science",
+    "algorithm",
+    "model",
+    "training",
+)
+_AFRICAN_CONFIDENCE_TERMS = frozenset(
+    ("africa", "kenya", "nigeria", "ghana", "south africa", "rwanda")
+)
+_AI_CONFIDENCE_TERMS = frozenset(
+    ("artificial intelligence", "machine learning", "ai", "ml", "deep learning")
+)
+
+_SENTENCE_URL_RE = re.compile(r"https?://[^\s]+")
+# Sentence ends, without splitting the dots inside URLs
+_SENTENCE_END_RE = re.compile(r"\.(?=\s|$)")
+_URL_DOMAIN_RE = re.compile(r"https?://(?:www\.)?([^/]+)")
+_AUTHOR_SEPARATOR_RE = re.compile(r",\s*(?:and\s+)?|\s+and\s+")
+
 
 class CitationType(Enum):
     """Types of citations that can be extracted"""
@@ -37,7 +233,57 @@ class CitationType(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+def _url_host(url: str) -> str:
+    """Lowercase hostname of a URL, accepting scheme-less www. links"""
+    try:
+        return urlsplit(url if "://" in url else f"//{url}").hostname or ""
+    except ValueError:
+        return ""
+
+
+# Host verdicts repeat across a snowball crawl, so memoize them
+@functools.lru_cache(maxsize=4096)
+def _classify_host(host: str) -> Optional[bool]:
+    """False for skipped (social media) hosts, True for academic hosts, else None"""
+    if _SKIP_RE.search(host):
+        return False
+    if _ACADEMIC_RE.search(host):
+        return True
+    return None
+
+
+def _uuid7() -> str:
+    """Time-ordered UUIDv7 (RFC 9562) so new citation ids append to the index"""
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF000 << 64) | 0x7000 << 64  # version 7
+    value = value & ~(0xC << 60) | 0x8 << 60  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
+def _normalize_url(url: str) -> str:
+    """Lowercase the scheme and host and drop trailing slashes for deduping"""
+    prefix, sep, rest = url.partition("://")
+    if not sep:
+        prefix, rest = "", url
+    host, slash, path = rest.partition("/")
+    normalized = f"{prefix.lower()}{sep}{host.lower()}{slash}{path}"
+    return normalized.rstrip("/")
+
+
+@dataclass(frozen=True, slots=True)
+class _ContextFeatures:
+    """Lowercased citation context and its relevance terms, computed once"""
+
+    text: str
+    lower: str
+    african_terms: List[str]
+    ai_terms: List[str]
+    # Whether the narrower confidence vocabularies matched
+    has_african: bool
+    has_ai: bool
+
+
+@dataclass(slots=True)
 class ExtractedCitation:
     """Represents a citation extracted from Perplexity response"""
 
@@ -61,10 +307,23 @@ class ExtractedCitation:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for database storage"""
-        data = asdict(self)
-        data["citation_type"] = self.citation_type.value
-        data["discovered_at"] = self.discovered_at.isoformat()
-        return data
+        return {
+            "id": self.id,
+            "title": self.title,
+            "url": self.url,
+            "citation_text": self.citation_text,
+            "confidence_score": self.confidence_score,
+            "citation_type": self.citation_type.value,
+            "discovered_at": self.discovered_at.isoformat(),
+            "source_response_id": self.source_response_id,
+            "processed": self.processed,
+            "authors": self.authors,
+            "publication_date": self.publication_date,
+            "journal": self.journal,
+            "doi": self.doi,
+            "african_relevance_indicators": self.african_relevance_indicators,
+            "ai_relevance_indicators": self.ai_relevance_indicators,
+        }
 
 
 class CitationExtractor:
@@ -72,36 +331,6 @@ class CitationExtractor:
 
     def __init__(self, db_connection=None):
         self.db = db_connection or get_supabase()
-        self.citation_patterns = self._init_citation_patterns()
-
-    def _init_citation_patterns(self) -> Dict[str, List[str]]:
-        """Initialize regex patterns for different citation types"""
-        return {
-            "url_patterns": [
-                r'https?://[^\s<>"{}|\\^`\[\]]+',
-                r'www\.[^\s<>"{}|\\^`\[\]]+',
-            ],
-            "doi_patterns": [
-                r"doi:?\s*10\.\d+/[^\s]+",
-                r"https?://doi\.org/10\.\d+/[^\s]+",
-                r"https?://dx\.doi\.org/10\.\d+/[^\s]+",
-            ],
-            "arxiv_patterns": [
-                r"arxiv:?\s*\d{4}\.\d{4,5}",
-                r"https?://arxiv\.org/abs/\d{4}\.\d{4,5}",
-            ],
-            "journal_patterns": [
-                r"published in ([^.]+)",
-                r"appeared in ([^.]+)",
-                r"(\w+ Journal of \w+)",
-                r"(Nature|Science|Cell|PNAS)\s+(?:journal)?",
-            ],
-            "author_patterns": [
-                r"by ([A-Z][a-z]+ [A-Z][a-z]+(?:,?\s+(?:and\s+)?[A-Z][a-z]+ [A-Z][a-z]+)*)",
-                r"authored by ([^.]+)",
-                r"researchers? ([^.]+)",
-            ],
-        }
 
     async def extract_citations_from_response(
         self, response_content: str, response_id: str, context: Dict[str, Any] = None
@@ -110,48 +339,49 @@ class CitationExtractor:
 
         citations = []
 
+        # One discovery timestamp shared by every citation in the response
+        discovered_at = datetime.now(timezone.utc)
+
         # Extract URLs and create citations
         urls = await self._extract_urls(response_content)
 
-        for url in urls:
+        for url, start, end in urls:
             # Get context around the URL
-            url_context = self._get_url_context(response_content, url)
+            url_context = self._get_url_context(response_content, start, end)
+
+            features = self._context_features(url_context)
 
             # Determine citation type
-            citation_type = self._classify_citation_type(url, url_context)
+            citation_type = self._classify_citation_type(url, features)
 
             # Extract title and metadata
             title = self._extract_title_from_context(url_context, url)
 
             # Calculate confidence score
-            confidence = self._calculate_citation_confidence(
-                url, url_context, citation_type
-            )
+            confidence = self._calculate_citation_confidence(features, citation_type)
 
             # Create citation object
             citation = ExtractedCitation(
-                id=str(uuid.uuid4()),
+                id=_uuid7(),
                 title=title,
                 url=url,
                 citation_text=url_context,
                 confidence_score=confidence,
                 citation_type=citation_type,
-                discovered_at=datetime.now(),
+                discovered_at=discovered_at,
                 source_response_id=response_id,
                 authors=self._extract_authors(url_context),
                 journal=self._extract_journal(url_context),
                 doi=self._extract_doi(url_context),
-                african_relevance_indicators=self._extract_african_indicators(
-                    url_context
-                ),
-                ai_relevance_indicators=self._extract_ai_indicators(url_context),
+                african_relevance_indicators=features.african_terms,
+                ai_relevance_indicators=features.ai_terms,
             )
 
             citations.append(citation)
 
         # Also extract citations without URLs (text-only references)
         text_citations = self._extract_text_only_citations(
-            response_content, response_id
+            response_content, response_id, discovered_at
         )
         citations.extend(text_citations)
 
@@ -160,25 +390,46 @@ class CitationExtractor:
 
     async def _extract_urls(
         self, content: str, citation_type: str = "unknown"
-    ) -> List[str]:
-        """Extract URLs from content (with cache checking)"""
-        urls = set()
-
-        for pattern in self.citation_patterns["url_patterns"]:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                url = match.group().strip(".,;!?")
-                if await self._is_valid_citation_url(url, citation_type):
-                    urls.add(url)
+    ) -> List[Tuple[str, int, int]]:
+        """Extract (url, start, end) spans from content (with cache checking)"""
+
+        # First occurrence of each URL in order of appearance, keyed by its
+        # normalized form so case and trailing-slash variants are deduped
+        candidates: Dict[str, Tuple[str, int, int]] = {}
+        for pattern in _URL_PATTERNS:
+            for match in pattern.finditer(content):
+                raw_url = match.group().strip(".,;!?")
+                key = _normalize_url(raw_url)
+                if key not in candidates:
+                    start = match.start() + match.group().find(raw_url)
+                    candidates[key] = (raw_url, start, start + len(raw_url))
+
+        # Validate the unique candidates concurrently
+        is_valid = await asyncio.gather(
+            *(
+                self._is_valid_citation_url(raw_url, citation_type)
+                for raw_url, _, _ in candidates.values()
+            )
+        )
 
-        return list(urls)
+        return [
+            candidate
+            for candidate, valid in zip(candidates.values(), is_valid)
+            if valid
+        ]
 
     async def _is_valid_citation_url(
         self, url: str, citation_type: str = "unknown"
     ) -> bool:
         """Check if URL is likely to be a valid citation (with cache check)"""
 
-        # First check if this URL is cached as null
+        # Skip common non-citation hosts without a cache round-trip
+        domain_class = _classify_host(_url_host(url))
+        if domain_class is False:
+            logger.debug(f"URL {url} is on a skipped domain")
+            return False
+
+        # Then check if this URL is cached as null
         try:
             is_cached, cache_entry = await check_citation_cache(url, citation_type)
             if is_cached:
@@ -189,48 +440,9 @@ class CitationExtractor:
         except Exception as e:
             logger.warning(f"Error checking citation cache for {url}: {e}")
 
-        # Skip common non-citation URLs
-        skip_domains = [
-            "twitter.com",
-            "facebook.com",
-            "instagram.com",
-            "youtube.com",
-            "tiktok.com",
-            "linkedin.com",
-        ]
-
-        for domain in skip_domains:
-            if domain in url.lower():
-                # Cache this as permanently invalid
-                try:
-                    await cache_null_citation(
-                        url,
-                        citation_type,
-                        CacheReason.IRRELEVANT_CONTENT,
-                        {"skip_reason": "social_media_domain"},
-                    )
-                except Exception as e:
-                    logger.warning(f"Error caching null citation: {e}")
-                return False
-
         # Prefer academic and research URLs
-        academic_indicators = [
-            "arxiv.org",
-            "doi.org",
-            "pubmed",
-            "scholar.google",
-            "researchgate",
-            "acm.org",
-            "ieee.org",
-            "springer",
-            "nature.com",
-            "science.org",
-            "cell.com",
-        ]
-
-        for indicator in academic_indicators:
-            if indicator in url.lower():
-                return True
+        if domain_class:
+            return True
 
         # General validation
         is_valid = len(url) > 10 and ("http" in url or "www." in url)
@@ -249,39 +461,36 @@ class CitationExtractor:
 
         return is_valid
 
-    def _get_url_context(self, content: str, url: str) -> str:
-        """Get context around a URL for better understanding"""
+    def _get_url_context(self, content: str, start: int, end: int) -> str:
+        """Get context around a URL span for better understanding"""
 
-        # Find the URL position and extract surrounding text
-        url_pos = content.find(url)
-        if url_pos == -1:
-            return ""
+        return content[max(0, start - 200) : end + 200].strip()
 
-        start = max(0, url_pos - 200)
-        end = min(len(content), url_pos + len(url) + 200)
+    def _context_features(self, context: str) -> _ContextFeatures:
+        """Lowercase a citation context once and extract its relevance terms"""
 
-        return content[start:end].strip()
+        context_lower = context.lower()
+        african_terms = self._extract_african_indicators(context_lower)
+        ai_terms = self._extract_ai_indicators(context_lower)
+        return _ContextFeatures(
+            text=context,
+            lower=context_lower,
+            african_terms=african_terms,
+            ai_terms=ai_terms,
+            has_african=not _AFRICAN_CONFIDENCE_TERMS.isdisjoint(african_terms),
+            has_ai=not _AI_CONFIDENCE_TERMS.isdisjoint(ai_terms),
+        )
 
-    def _classify_citation_type(self, url: str, context: str) -> CitationType:
+    def _classify_citation_type(
+        self, url: str, features: _ContextFeatures
+    ) -> CitationType:
         """Classify the type of citation based on URL and context"""
 
         url_lower = url.lower()
-        context_lower = context.lower()
+        context_lower = features.lower
 
         # Academic papers
-        if any(
-            indicator in url_lower
-            for indicator in [
-                "arxiv",
-                "doi.org",
-                "pubmed",
-                "acm.org",
-                "ieee.org",
-                "springer",
-                "nature.com",
-                "science.org",
-            ]
-        ):
+        if _ACADEMIC_URL_RE.search(url_lower):
             return CitationType.ACADEMIC_PAPER
 
         # GitHub repositories
@@ -289,33 +498,15 @@ class CitationExtractor:
             return CitationType.GITHUB_REPO
 
         # Company websites
-        if any(
-            indicator in context_lower
-            for indicator in ["company", "startup", "founded", "ceo", "headquarters"]
-        ):
+        if _COMPANY_CONTEXT_RE.search(context_lower):
             return CitationType.COMPANY_WEBSITE
 
         # News articles
-        if any(
-            indicator in url_lower
-            for indicator in [
-                "techcrunch",
-                "reuters",
-                "bloomberg",
-                "cnn",
-                "bbc",
-                "news",
-                "blog",
-                "medium.com",
-            ]
-        ):
+        if _NEWS_URL_RE.search(url_lower):
             return CitationType.NEWS_ARTICLE
 
         # Reports
-        if any(
-            indicator in context_lower
-            for indicator in ["report", "survey", "analysis", "study", "whitepaper"]
-        ):
+        if _REPORT_CONTEXT_RE.search(context_lower):
             return CitationType.REPORT
 
         return CitationType.UNKNOWN
@@ -324,24 +515,17 @@ class CitationExtractor:
         """Extract title from context around URL"""
 
         # Look for quoted titles
-        quote_patterns = [
-            r'"([^"]+)"',
-            r"'([^']+)'",
-            r'titled\s+"([^"]+)"',
-            r'called\s+"([^"]+)"',
-        ]
-
-        for pattern in quote_patterns:
-            match = re.search(pattern, context, re.IGNORECASE)
+        for pattern in _QUOTE_PATTERNS:
+            match = pattern.search(context)
             if match and len(match.group(1)) > 10:
                 return match.group(1).strip()
 
         # Look for sentence containing the URL
-        sentences = context.split(".")
+        sentences = _SENTENCE_END_RE.split(context)
         for sentence in sentences:
             if url in sentence:
                 # Clean up the sentence and use it as title
-                clean_sentence = re.sub(r"https?://[^\s]+", "", sentence).strip()
+                clean_sentence = _SENTENCE_URL_RE.sub("", sentence).strip()
                 if len(clean_sentence) > 20:
                     return (
                         clean_sentence[:100] + "..."
@@ -350,14 +534,14 @@ class CitationExtractor:
                     )
 
         # Fallback: use domain name
-        domain_match = re.search(r"https?://(?:www\.)?([^/]+)", url)
+        domain_match = _URL_DOMAIN_RE.search(url)
         if domain_match:
-            return f"Resource from {domain_match.group(1)}"
+            return f"Resource from {domain_match.group(1).lower()}"
 
         return "Untitled Citation"
 
     def _calculate_citation_confidence(
-        self, url: str, context: str, citation_type: CitationType
+        self, features: _ContextFeatures, citation_type: CitationType
     ) -> float:
         """Calculate confidence score for citation"""
 
@@ -372,30 +556,15 @@ class CitationExtractor:
             base_score += 0.2
 
         # Boost for African relevance
-        african_indicators = [
-            "africa",
-            "kenya",
-            "nigeria",
-            "ghana",
-            "south africa",
-            "rwanda",
-        ]
-        if any(indicator in context.lower() for indicator in african_indicators):
+        if features.has_african:
             base_score += 0.1
 
         # Boost for AI relevance
-        ai_indicators = [
-            "artificial intelligence",
-            "machine learning",
-            "ai",
-            "ml",
-            "deep learning",
-        ]
-        if any(indicator in context.lower() for indicator in ai_indicators):
+        if features.has_ai:
             base_score += 0.1
 
         # Penalty for unclear context
-        if len(context) < 50:
+        if len(features.text) < 50:
             base_score -= 0.1
 
         return min(1.0, max(0.1, base_score))
@@ -405,12 +574,12 @@ class CitationExtractor:
 
         authors = []
 
-        for pattern in self.citation_patterns["author_patterns"]:
-            match = re.search(pattern, context, re.IGNORECASE)
+        for pattern in _AUTHOR_PATTERNS:
+            match = pattern.search(context)
             if match:
                 author_string = match.group(1)
                 # Split by commas and 'and'
-                author_list = re.split(r",\s*(?:and\s+)?|\s+and\s+", author_string)
+                author_list = _AUTHOR_SEPARATOR_RE.split(author_string)
                 authors.extend(
                     [author.strip() for author in author_list if author.strip()]
                 )
@@ -420,8 +589,8 @@ class CitationExtractor:
     def _extract_journal(self, context: str) -> Optional[str]:
         """Extract journal name from context"""
 
-        for pattern in self.citation_patterns["journal_patterns"]:
-            match = re.search(pattern, context, re.IGNORECASE)
+        for pattern in _JOURNAL_PATTERNS:
+            match = pattern.search(context)
             if match:
                 return match.group(1).strip()
 
@@ -430,107 +599,57 @@ class CitationExtractor:
     def _extract_doi(self, context: str) -> Optional[str]:
         """Extract DOI from context"""
 
-        for pattern in self.citation_patterns["doi_patterns"]:
-            match = re.search(pattern, context, re.IGNORECASE)
+        # Every DOI pattern needs a "10." registrant prefix; skip the scans without one
+        if "10." not in context:
+            return None
+
+        for pattern in _DOI_PATTERNS:
+            match = pattern.search(context)
             if match:
                 return match.group().strip()
 
         return None
 
-    def _extract_african_indicators(self, context: str) -> List[str]:
-        """Extract indicators of African relevance"""
-
-        african_terms = [
-            "africa",
-            "african",
-            "nigeria",
-            "kenya",
-            "ghana",
-            "south africa",
-            "rwanda",
-            "uganda",
-            "tanzania",
-            "egypt",
-            "morocco",
-            "tunisia",
-            "lagos",
-            "nairobi",
-            "cape town",
-            "cairo",
-            "accra",
-            "kigali",
-        ]
+    def _extract_african_indicators(self, context_lower: str) -> List[str]:
+        """Extract indicators of African relevance from lowercased context"""
 
-        found_terms = []
-        context_lower = context.lower()
+        return [term for term in _AFRICAN_TERMS if term in context_lower]
 
-        for term in african_terms:
-            if term in context_lower:
-                found_terms.append(term)
-
-        return found_terms
-
-    def _extract_ai_indicators(self, context: str) -> List[str]:
-        """Extract indicators of AI relevance"""
-
-        ai_terms = [
-            "artificial intelligence",
-            "machine learning",
-            "deep learning",
-            "neural network",
-            "ai",
-            "ml",
-            "nlp",
-            "computer vision",
-            "data science",
-            "algorithm",
-            "model",
-            "training",
-        ]
+    def _extract_ai_indicators(self, context_lower: str) -> List[str]:
+        """Extract indicators of AI relevance from lowercased context"""
 
-        found_terms = []
-        context_lower = context.lower()
-
-        for term in ai_terms:
-            if term in context_lower:
-                found_terms.append(term)
-
-        return found_terms
+        return [term for term in _AI_TERMS if term in context_lower]
 
     def _extract_text_only_citations(
-        self, content: str, response_id: str
+        self, content: str, response_id: str, discovered_at: datetime
     ) -> List[ExtractedCitation]:
         """Extract citations that don't have URLs but are referenced in text"""
 
         citations = []
 
-        # Look for patterns like "According to a study by..." or "Research from..."
-        reference_patterns = [
-            r"according to a (?:study|report|paper|research)(?:\s+by\s+([^,\.]+))?[^\.]*\.([^\.]*)",
-            r"research from ([^,\.]+)[^\.]*\.([^\.]*)",
-            r"a (?:study|report|paper) by ([^,\.]+)[^\.]*\.([^\.]*)",
-            r'(?:paper|study) titled "([^"]+)"[^\.]*\.([^\.]*)',
-        ]
+        # Most responses have no narrative references; skip the regex scans
+        content_lower = content.lower()
+        if not any(trigger in content_lower for trigger in _REFERENCE_TRIGGERS):
+            return citations
 
-        for pattern in reference_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
+        # Look for patterns like "According to a study by..." or "Research from..."
+        for pattern in _REFERENCE_PATTERNS:
+            for match in pattern.finditer(content):
                 title = match.group(1) if match.group(1) else "Referenced Study"
                 context = match.group(0)
+                features = self._context_features(context)
 
                 citation = ExtractedCitation(
-                    id=str(uuid.uuid4()),
+                    id=_uuid7(),
                     title=title,
                     url=None,
                     citation_text=context,
                     confidence_score=0.6,  # Lower confidence for text-only
                     citation_type=CitationType.ACADEMIC_PAPER,
-                    discovered_at=datetime.now(),
+                    discovered_at=discovered_at,
                     source_response_id=response_id,
-                    african_relevance_indicators=self._extract_african_indicators(
-                        context
-                    ),
-                    ai_relevance_indicators=self._extract_ai_indicators(context),
+                    african_relevance_indicators=features.african_terms,
+                    ai_relevance_indicators=features.ai_terms,
                 )
 
                 citations.append(citation)
@@ -545,41 +664,41 @@ class CitationExtractor:
     ) -> List[str]:
         """Store citations in database and return their IDs"""
 
-        stored_ids = []
+        if not citations:
+            return []
 
+        rows = []
         for citation in citations:
-            try:
-                # Insert into enrichment_citations table
-                citation_data = citation.to_dict()
-                citation_data["publication_id"] = source_publication_id
-                citation_data["innovation_id"] = source_innovation_id
-                
-                # Convert datetime to ISO string for Supabase
-                if "discovered_at" in citation_data and citation_data["discovered_at"]:
-                    citation_data["discovered_at"] = citation_data["discovered_at"].isoformat()
-
-                # Use Supabase client instead of SQLAlchemy
-                response = self.db.table("enrichment_citations").insert(citation_data).execute()
-                
-                if response.data:
-                    stored_ids.append(citation.id)
-                    logger.info(f"Stored citation: {citation.title[:50]}...")
-                else:
-                    logger.warning(f"No data returned when storing citation {citation.id}")
+            citation_data = citation.to_dict()
+            citation_data["publication_id"] = source_publication_id
+            citation_data["innovation_id"] = source_innovation_id
+            rows.append(citation_data)
 
-            except Exception as e:
-                logger.error(f"Failed to store citation {citation.id}: {e}")
+        try:
+            # One multi-row insert (a single statement) for the whole batch
+            response = self.db.table("enrichment_citations").insert(rows).execute()
+        except Exception as e:
+            logger.error(f"Failed to store {len(citations)} citations: {e}")
+            return []
+
+        if not response.data:
+            logger.warning(f"No data returned when storing {len(citations)} citations")
+            return []
 
+        stored_ids = [row["id"] for row in response.data]
+        logger.info(f"Stored {len(stored_ids)} citations")
         return stored_ids
 
-    async def get_unprocessed_citations(self, limit: int = 50) -> List[Dict[str, Any]]:
+    async def get_unprocessed_citations(
+        self, limit: int = 50, columns: str = "*"
+    ) -> List[Dict[str, Any]]:
         """Get citations that haven't been processed for snowball sampling"""
 
         try:
             # Use Supabase client to query unprocessed citations
             response = (
                 self.db.table("enrichment_citations")
-                .select("*")
+                .select(columns)
                 .eq("processed", False)
                 .gte("confidence_score", 0.7)
                 .order("confidence_score", desc=True)
@@ -610,43 +729,77 @@ class CitationExtractor:
             logger.error(f"Failed to mark citation {citation_id} as processed: {e}")
             return False
 
-    async def create_snowball_discovery_queue(self) -> List[Dict[str, Any]]:
-        """Create a queue of citations for snowball sampling discovery"""
+    async def mark_citations_processed(self, citation_ids: List[str]) -> int:
+        """Mark a batch of citations as processed with a single update"""
 
-        unprocessed_citations = await self.get_unprocessed_citations()
+        if not citation_ids:
+            return 0
 
-        discovery_queue = []
-
-        for citation in unprocessed_citations:
-            # Prioritize academic papers and high-confidence citations
-            priority_score = citation["confidence_score"]
-
-            if citation["citation_type"] == "academic_paper":
-                priority_score += 0.2
+        try:
+            response = (
+                self.db.table("enrichment_citations")
+                .update({"processed": True, "processed_at": datetime.now().isoformat()})
+                .in_("id", citation_ids)
+                .execute()
+            )
 
-            # Boost African AI content
-            if citation.get("african_relevance_indicators") and citation.get(
-                "ai_relevance_indicators"
-            ):
-                priority_score += 0.1
+            return len(response.data) if response.data else 0
+        except Exception as e:
+            logger.error(
+                f"Failed to mark {len(citation_ids)} citations as processed: {e}"
+            )
+            return 0
 
-            discovery_item = {
-                "citation_id": citation["id"],
-                "title": citation["title"],
-                "url": citation["url"],
-                "priority_score": min(1.0, priority_score),
-                "citation_type": citation["citation_type"],
-                "discovery_method": "snowball_sampling",
-            }
+    async def create_snowball_discovery_queue(
+        self, limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Create a queue of the top citations for snowball sampling discovery"""
 
-            discovery_queue.append(discovery_item)
+        # Only the most confident candidates can reach the top after the boosts
+        unprocessed_citations = await self.get_unprocessed_citations(
+            limit * DISCOVERY_CANDIDATE_FACTOR, columns=_DISCOVERY_COLUMNS
+        )
+        discovery_queue = [
+            self._discovery_item(citation) for citation in unprocessed_citations
+        ]
 
-        # Sort by priority score
+        # Sort by priority score, keeping the query order for ties
         discovery_queue.sort(key=lambda x: x["priority_score"], reverse=True)
+        discovery_queue = discovery_queue[:limit]
 
         logger.info(f"Created discovery queue with {len(discovery_queue)} items")
         return discovery_queue
 
+    def _discovery_item(self, citation: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a discovery queue item with its snowball sampling priority"""
+
+        # Prioritize academic papers and high-confidence citations
+        priority_score = citation["confidence_score"]
+
+        if citation["citation_type"] == "academic_paper":
+            priority_score += 0.2
+
+        # Boost African AI content
+        if citation.get("african_relevance_indicators") and citation.get(
+            "ai_relevance_indicators"
+        ):
+            priority_score += 0.1
+
+        return {
+            "citation_id": citation["id"],
+            "title": citation["title"],
+            "url": citation["url"],
+            "priority_score": min(1.0, priority_score),
+            "citation_type": citation["citation_type"],
+            "discovery_method": "snowball_sampling",
+        }
+
+
+@functools.lru_cache(maxsize=None)
+def _default_extractor() -> CitationExtractor:
+    """Shared extractor for the integration path, created on first use"""
+    return CitationExtractor()
+
 
 # Integration function for existing pipeline
 async def enhance_perplexity_response_with_citations(
@@ -662,7 +815,7 @@ async def enhance_perplexity_response_with_citations(
         Tuple of (original_content, extracted_citations_data)
     """
 
-    extractor = CitationExtractor()
+    extractor = _default_extractor()
 
     # Extract citations
     citations = await extractor.extract_citations_from_response(
@@ -24,6 +24,7 @@ from typing import Any, Dict, List, Optional
 from config.database import supabase
 from loguru import logger
 from services.ai_backfill_service import (
+    BackfillPriority,
     ai_backfill_service,
     create_backfill_jobs_for_innovations,
 )
@@ -102,7 +103,7 @@ class BackfillIntegrationService:
             high_priority_jobs = [
                 job
                 for job in backfill_jobs
-                if job.priority.value in ["critical", "high"]
+                if job.priority <= BackfillPriority.HIGH
             ]
             processed_jobs = await ai_backfill_service.run_scheduled_backfill(
                 max_jobs=min(10, len(high_priority_jobs))
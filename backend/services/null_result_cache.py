@@ -9,10 +9,11 @@ and reduce costs. Implements intelligent cache invalidation and retry logic.
 import asyncio
 import hashlib
 import json
+import time
 from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Set, Tuple
 
 import redis.asyncio as aioredis
 from config.settings import settings
@@ -44,6 +45,7 @@ class DataSource(Enum):
     PUBMED_API = "pubmed_api"
     COMPANY_WEBSITE = "company_website"
     CITATION_EXTRACTION = "citation_extraction"
+    OPENAI = "openai"
 
 
 @dataclass
@@ -118,6 +120,8 @@ class NullResultCache:
                 self.redis_url = base_url
 
         self.redis: Optional[aioredis.Redis] = None
+        # Open `async with` blocks sharing the client
+        self._users = 0
         self.cache_prefix = "null_cache:"
 
         # Cache TTL settings by reason (in hours)
@@ -132,6 +136,12 @@ class NullResultCache:
             CacheReason.IRRELEVANT_CONTENT: 72,  # 3 days - relevance is stable
         }
 
+        # Keys known to exist per data source, rebuilt by a periodic SCAN so
+        # lookups for never-cached queries can skip Redis entirely
+        self._key_index: Dict[DataSource, Set[str]] = {}
+        self._key_index_loaded_at: Dict[DataSource, float] = {}
+        self.key_index_refresh_seconds = 300
+
         # Retry settings
         self.max_retries = {
             CacheReason.NO_CONTENT_FOUND: 3,
@@ -145,9 +155,18 @@ class NullResultCache:
         }
 
     async def __aenter__(self):
-        """Async context manager entry"""
+        """Async context manager entry
+
+        Concurrent `async with` blocks on one instance (such as the module
+        singleton) share a single client, closed when the last block exits.
+        """
+        self._users += 1
+        if self.redis is not None:
+            return self
+
+        # Assigned before the first await so concurrent entries reuse this client
+        self.redis = aioredis.from_url(self.redis_url, decode_responses=True)
         try:
-            self.redis = await aioredis.from_url(self.redis_url, decode_responses=True)
             # Test the connection
             await self.redis.ping()
             return self
@@ -159,20 +178,26 @@ class NullResultCache:
                 base_url = self.redis_url.split("://")[0] + "://" + self.redis_url.split("@")[1]
                 logger.info(f"Retrying Redis connection without auth: {base_url}")
                 try:
-                    self.redis = await aioredis.from_url(base_url, decode_responses=True)
+                    await self.redis.close()
+                    self.redis = aioredis.from_url(base_url, decode_responses=True)
                     await self.redis.ping()
                     logger.info("Successfully connected to Redis without authentication")
                     return self
                 except Exception as e2:
                     logger.error(f"Failed to connect to Redis without auth: {e2}")
+                    await self.__aexit__(None, None, None)
                     raise e  # Re-raise original error
             else:
+                await self.__aexit__(None, None, None)
                 raise e
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit"""
-        if self.redis:
-            await self.redis.close()
+        self._users -= 1
+        if self._users == 0 and self.redis:
+            # Detach before awaiting so a concurrent entry opens a fresh client
+            redis, self.redis = self.redis, None
+            await redis.close()
 
     def _generate_cache_key(
         self, data_source: DataSource, query_params: Dict[str, Any]
@@ -196,6 +221,44 @@ class NullResultCache:
 
         return f"{self.cache_prefix}{data_source.value}:{param_hash}"
 
+    def _key_index_is_fresh(self, data_source: DataSource) -> bool:
+        """Whether the key index for a data source was loaded recently"""
+        loaded_at = self._key_index_loaded_at.get(data_source)
+        return (
+            loaded_at is not None
+            and time.monotonic() - loaded_at < self.key_index_refresh_seconds
+        )
+
+    def may_be_cached(
+        self, data_source: DataSource, query_params: Dict[str, Any]
+    ) -> bool:
+        """False only when a fresh key index shows no entry exists for the query"""
+
+        keys = self._key_index.get(data_source)
+        if keys is None or not self._key_index_is_fresh(data_source):
+            return True
+        return self._generate_cache_key(data_source, query_params) in keys
+
+    async def refresh_key_index(self, data_source: DataSource):
+        """Reload the known cache keys for a data source from Redis"""
+
+        # Claim the refresh first so concurrent lookups don't all rescan
+        self._key_index_loaded_at[data_source] = time.monotonic()
+        try:
+            self._key_index[data_source] = {
+                key
+                async for key in self.redis.scan_iter(
+                    match=f"{self.cache_prefix}{data_source.value}:*", count=1000
+                )
+            }
+            logger.debug(
+                f"Indexed {len(self._key_index[data_source])} null cache keys for {data_source.value}"
+            )
+        except Exception as e:
+            self._key_index.pop(data_source, None)
+            self._key_index_loaded_at.pop(data_source, None)
+            logger.warning(f"Error indexing null cache keys: {e}")
+
     async def is_cached_as_null(
         self, data_source: DataSource, query_params: Dict[str, Any]
     ) -> Tuple[bool, Optional[NullResultEntry]]:
@@ -279,6 +342,8 @@ class NullResultCache:
             await self.redis.setex(
                 cache_key, cache_ttl_seconds, json.dumps(entry.to_dict())
             )
+            if data_source in self._key_index:
+                self._key_index[data_source].add(cache_key)
 
             logger.info(
                 f"Cached null result for {data_source.value}: {reason.value} (retry #{retry_count}, permanent={permanent})"
@@ -440,7 +505,15 @@ async def check_citation_cache(
 
     query_params = {"url": url, "citation_type": citation_type}
 
+    # Most extracted URLs were never cached; skip the Redis round-trip for them
+    if not null_result_cache.may_be_cached(
+        DataSource.CITATION_EXTRACTION, query_params
+    ):
+        return False, None
+
     async with null_result_cache as cache:
+        if not cache._key_index_is_fresh(DataSource.CITATION_EXTRACTION):
+            await cache.refresh_key_index(DataSource.CITATION_EXTRACTION)
         return await cache.is_cached_as_null(
             DataSource.CITATION_EXTRACTION, query_params
         )
@@ -46,16 +46,20 @@ class SerperSearchResponse(BaseModel):
 class SerperService:
     """Service for precision searches using Serper.dev API"""
 
-    def __init__(self):
+    def __init__(self, connector: Optional[aiohttp.BaseConnector] = None):
         self.api_key = settings.SERPER_API_KEY
         self.base_url = "https://google.serper.dev"
         self.session = None
+        # Optional shared connection pool, owned by the caller
+        self.connector = connector
 
     async def __aenter__(self):
         """Async context manager entry"""
         self.session = aiohttp.ClientSession(
             headers={"X-API-KEY": self.api_key, "Content-Type": "application/json"},
             timeout=aiohttp.ClientTimeout(total=30),
+            connector=self.connector,
+            connector_owner=self.connector is None,
         )
         return self
 
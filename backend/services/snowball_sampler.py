@@ -83,7 +83,9 @@ class SnowballSampler:
         try:
             # Get initial citation queue
             discovery_queue = (
-                await self.citation_extractor.create_snowball_discovery_queue()
+                await self.citation_extractor.create_snowball_discovery_queue(
+                    limit=self.config.max_citations_per_batch
+                )
             )
 
             if not discovery_queue:
@@ -164,38 +166,47 @@ class SnowballSampler:
         # Limit batch size
         batch = queue[: self.config.max_citations_per_batch]
 
-        for citation_item in batch:
-            try:
-                # Process individual citation
-                citation_results = await self._process_single_citation(
-                    citation_item, depth
-                )
+        # Citations actually fetched, marked processed in one update at the end
+        attempted_ids = []
+        try:
+            for citation_item in batch:
+                citation_url = citation_item.get("url")
+                if citation_url and citation_url not in self.processed_urls:
+                    attempted_ids.append(citation_item.get("citation_id"))
+
+                try:
+                    # Process individual citation
+                    citation_results = await self._process_single_citation(
+                        citation_item, depth
+                    )
 
-                results["processed_count"] += 1
+                    results["processed_count"] += 1
 
-                if citation_results["success"]:
-                    results["discoveries_count"] += citation_results[
-                        "discoveries_count"
-                    ]
-                    results["quality_scores"].append(
-                        citation_results["average_quality"]
-                    )
+                    if citation_results["success"]:
+                        results["discoveries_count"] += citation_results[
+                            "discoveries_count"
+                        ]
+                        results["quality_scores"].append(
+                            citation_results["average_quality"]
+                        )
 
-                    # Add new citations to next depth queue
-                    for new_citation in citation_results["new_citations"]:
-                        if self._should_include_in_next_depth(new_citation):
-                            results["next_depth_queue"].append(new_citation)
-                else:
-                    results["failed_count"] += 1
+                        # Add new citations to next depth queue
+                        for new_citation in citation_results["new_citations"]:
+                            if self._should_include_in_next_depth(new_citation):
+                                results["next_depth_queue"].append(new_citation)
+                    else:
+                        results["failed_count"] += 1
 
-                # Rate limiting
-                await asyncio.sleep(self.config.delay_between_requests)
+                    # Rate limiting
+                    await asyncio.sleep(self.config.delay_between_requests)
 
-            except Exception as e:
-                logger.error(
-                    f"Failed to process citation {citation_item.get('citation_id')}: {e}"
-                )
-                results["failed_count"] += 1
+                except Exception as e:
+                    logger.error(
+                        f"Failed to process citation {citation_item.get('citation_id')}: {e}"
+                    )
+                    results["failed_count"] += 1
+        finally:
+            await self.citation_extractor.mark_citations_processed(attempted_ids)
 
         return results
 
@@ -225,9 +236,8 @@ class SnowballSampler:
             return result
 
         try:
-            # Mark as processed
+            # Marked in the database by _process_depth_level once the level ends
             self.processed_urls.add(citation_url)
-            await self.citation_extractor.mark_citation_processed(citation_id)
 
             # Attempt to extract content and find new citations
             content = await self._fetch_citation_content(citation_url)
@@ -383,9 +393,11 @@ class SnowballSampler:
             data = {
                 "session_id": session_stats["session_id"],
                 "start_time": session_stats["start_time"].isoformat(),
-                "end_time": session_stats.get("end_time").isoformat()
-                if session_stats.get("end_time")
-                else None,
+                "end_time": (
+                    session_stats.get("end_time").isoformat()
+                    if session_stats.get("end_time")
+                    else None
+                ),
                 "duration": session_stats.get("duration", 0),
                 "citations_processed": session_stats["citations_processed"],
                 "new_discoveries": session_stats["new_discoveries"],
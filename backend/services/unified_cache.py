@@ -154,6 +154,7 @@ class UnifiedCacheService:
             (DataSource.PUBMED_API, CacheType.POSITIVE): 48,
             (DataSource.COMPANY_WEBSITE, CacheType.POSITIVE): 24,
             (DataSource.CITATION_EXTRACTION, CacheType.POSITIVE): 12,
+            (DataSource.OPENAI, CacheType.POSITIVE): 24,
             # Negative results - shorter cache times for retries
             (DataSource.PERPLEXITY, CacheType.NEGATIVE): 4,
             (DataSource.SERPER, CacheType.NEGATIVE): 2,
@@ -164,6 +165,7 @@ class UnifiedCacheService:
             (DataSource.PUBMED_API, CacheType.NEGATIVE): 8,
             (DataSource.COMPANY_WEBSITE, CacheType.NEGATIVE): 12,
             (DataSource.CITATION_EXTRACTION, CacheType.NEGATIVE): 3,
+            (DataSource.OPENAI, CacheType.NEGATIVE): 1,
         }
 
         # Compression thresholds (bytes)
@@ -12,6 +12,9 @@ from loguru import logger
 from pinecone import Pinecone
 from pydantic import BaseModel
 
+# Inputs per Pinecone inference call (multilingual-e5-large accepts up to 96)
+EMBED_BATCH_SIZE = 96
+
 
 class VectorDocument(BaseModel):
     """Document for vector storage"""
@@ -94,6 +97,35 @@ class VectorService:
             logger.error(f"Error generating embedding: {e}")
             return []
 
+    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Generate embeddings for several texts with batched inference calls"""
+        try:
+            if not self.index:
+                await self.initialize()
+
+            embeddings = []
+            for i in range(0, len(texts), EMBED_BATCH_SIZE):
+                # Off the event loop, so concurrent callers overlap their requests
+                response = await asyncio.to_thread(
+                    self.pc.inference.embed,
+                    model="multilingual-e5-large",
+                    inputs=texts[i : i + EMBED_BATCH_SIZE],
+                    parameters={"input_type": "passage"},
+                )
+                embeddings.extend(item["values"] for item in response)
+
+            if len(embeddings) != len(texts):
+                logger.error(
+                    f"Expected {len(texts)} embeddings from Pinecone, got {len(embeddings)}"
+                )
+                return [[] for _ in texts]
+
+            return embeddings
+
+        except Exception as e:
+            logger.error(f"Error generating embeddings: {e}")
+            return [[] for _ in texts]
+
     async def upsert_documents(self, documents: List[VectorDocument]) -> bool:
         """Upsert documents to Pinecone using embeddings"""
         try:
@@ -187,18 +219,7 @@ class VectorService:
                 filter=filter_metadata,
             )
 
-            # Parse results
-            results = []
-            for match in search_response.matches:
-                result = SearchResult(
-                    id=match.id,
-                    score=match.score,
-                    metadata=match.metadata,
-                    content=match.metadata.get(
-                        "text", match.metadata.get("content", "")
-                    ),
-                )
-                results.append(result)
+            results = self._parse_matches(search_response)
 
             logger.info(
                 f"Found {len(results)} similar documents for query: {query[:50]}..."
@@ -209,6 +230,61 @@ class VectorService:
             logger.error(f"Error searching similar documents: {e}")
             return []
 
+    async def search_similar_batch(
+        self,
+        queries: List[str],
+        top_k: int = 10,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[List[SearchResult]]:
+        """Search for several queries, embedding them together and querying concurrently"""
+        try:
+            if not self.index:
+                await self.initialize()
+
+            query_texts = [self.prepare_text(query) for query in queries]
+            embeddings = iter(
+                await self.embed_texts([text for text in query_texts if text])
+            )
+
+            async def query_index(embedding: List[float]) -> List[SearchResult]:
+                if not embedding:
+                    return []
+                try:
+                    search_response = await asyncio.to_thread(
+                        self.index.query,
+                        vector=embedding,
+                        top_k=top_k,
+                        include_metadata=True,
+                        filter=filter_metadata,
+                    )
+                    return self._parse_matches(search_response)
+                except Exception as e:
+                    logger.error(f"Error searching similar documents: {e}")
+                    return []
+
+            results = await asyncio.gather(
+                *(query_index(next(embeddings) if text else []) for text in query_texts)
+            )
+
+            logger.info(f"Ran batched similarity search for {len(queries)} queries")
+            return results
+
+        except Exception as e:
+            logger.error(f"Error in batched similarity search: {e}")
+            return [[] for _ in queries]
+
+    def _parse_matches(self, search_response) -> List[SearchResult]:
+        """Convert Pinecone query matches to search results"""
+        return [
+            SearchResult(
+                id=match.id,
+                score=match.score,
+                metadata=match.metadata,
+                content=match.metadata.get("text", match.metadata.get("content", "")),
+            )
+            for match in search_response.matches
+        ]
+
     async def search_innovations(
         self,
         query: str,
@@ -235,6 +311,24 @@ class VectorService:
         top_k: int = 20,
     ) -> List[SearchResult]:
         """Search for publications with filters"""
+        filter_dict = self._publication_filter(publication_type, year_from)
+        return await self.search_similar(query, top_k, filter_dict)
+
+    async def batch_search_publications(
+        self,
+        queries: List[str],
+        publication_type: Optional[str] = None,
+        year_from: Optional[int] = None,
+        top_k: int = 20,
+    ) -> List[List[SearchResult]]:
+        """Search publications for several queries at once, results in query order"""
+        filter_dict = self._publication_filter(publication_type, year_from)
+        return await self.search_similar_batch(queries, top_k, filter_dict)
+
+    def _publication_filter(
+        self, publication_type: Optional[str], year_from: Optional[int]
+    ) -> Dict[str, Any]:
+        """Metadata filter for publication searches"""
         filter_dict = {"document_type": "publication"}
 
         if publication_type:
@@ -243,7 +337,7 @@ class VectorService:
         if year_from:
             filter_dict["year"] = {"$gte": year_from}
 
-        return await self.search_similar(query, top_k, filter_dict)
+        return filter_dict
 
     async def add_innovation(
         self,